@@ -1,4 +1,5 @@
 from .lagrange import Lagrange
+from .barycentric import Barycentric
 from .naville import Naville
 from .hermite import Hermite
 from .newton_divided_diff import NewtonDivDiff
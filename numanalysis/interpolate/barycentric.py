@@ -0,0 +1,229 @@
+from numpy.polynomial import Polynomial as P
+import numpy as np
+from interpolate.interpolate_base import ABCInterpolate
+
+class Barycentric(ABCInterpolate):
+
+    """
+    Barycentric Lagrange Interpolation (second form).
+    The interpolating polynomial P on n+1 distinct numbers x0,...,xn is written as
+
+    P(x) = sum_i (w_i f(xi) / (x - xi)) / sum_i (w_i / (x - xi)),
+
+    with weights w_i = 1 / prod_{j != i} (xi - xj). The weights are computed once in
+    O(n^2); every evaluation then costs O(n) per point and appending a node costs O(n).
+    They are stored rescaled to max |w_i| = 1, together with the log of the common
+    factor, so that neither many nodes nor a wide span overflow or underflow.
+    Chebyshev nodes have closed-form weights, see `Barycentric.chebyshev`.
+
+    Parameters
+    ----------
+    x_data : array_like
+        numbers x0, x1,..., xn
+    y_data : array_like
+        numbers f(x0), f(x1), ..., f(xn)
+
+    Reference:
+    Berrut, J.-P., & Trefethen, L. N. (2004). Barycentric Lagrange Interpolation. SIAM Review, 46(3), 501-517.
+    """
+
+    def __init__(self, x_data, y_data):
+        super().__init__(x_data, y_data)
+
+    @classmethod
+    def chebyshev(cls, fun, degree: int, bounds = (-1, 1), kind = 2):
+        """
+        Interpolate `fun` on the degree + 1 Chebyshev points of the first or second
+        kind in [a, b], using the closed-form barycentric weights.
+
+        Parameters
+        ----------
+        fun : callable
+            Function f(x) to be interpolated, evaluated on an array of nodes
+        degree : int
+            Degree of the interpolating polynomial
+        bounds : array_like
+            Interval of the form [a, b]
+        kind : int
+            1 - roots of T_{n+1}, 2 - extrema of T_n (including the endpoints)
+
+        Returns
+        -------
+        interpolator : Barycentric
+        """
+        a, b = bounds[0], bounds[1]
+        j = np.arange(degree + 1)
+
+        if kind == 1:
+            theta = (2 * j + 1) * np.pi / (2 * degree + 2)
+            weights = (-1.0) ** j * np.sin(theta)
+
+        elif kind == 2:
+            if degree < 1:
+                raise ValueError("Chebyshev points of the second kind need degree >= 1")
+
+            theta = j * np.pi / degree
+            weights = (-1.0) ** j
+            weights[[0, -1]] *= 0.5
+
+        else:
+            raise ValueError("Invalid kind. Choose from: [1, 2]")
+
+        nodes = (a + b) / 2 + (b - a) / 2 * np.cos(theta)
+        interpolator = cls(nodes, fun(nodes))
+
+        # Weights are only defined up to a common factor, which cancels in the second form
+        interpolator._cache = (weights,) + cls._factor(weights, nodes)
+
+        return interpolator
+
+    def fit(self, eval):
+        """
+        Evaluate the interpolating polynomial P with the barycentric formula.
+
+        Parameters:
+        -----------
+        eval : float or array_like
+            point(s) where polynomial P is to approximated
+
+        Returns
+        -------
+        P(eval) : float or np.ndarray
+            Polynomial P evaluated at `eval`, with the same shape as `eval`
+        """
+
+        weights, _, _ = self._state()
+        x_data = self.x_data
+        y_data = self.y_data
+
+        def kernel(points):
+            d = points[:, np.newaxis] - x_data[np.newaxis, :]
+
+            # Points that coincide with a node take the tabulated value
+            exact = d == 0
+            d[exact] = 1
+
+            t = weights / d
+            values = (t @ y_data) / np.sum(t, axis = 1)
+
+            rows, cols = np.nonzero(exact)
+            values[rows] = y_data[cols]
+
+            return values
+
+        return self._evaluate(eval, kernel)
+
+    def _prepare(self):
+        """
+        Barycentric weights, rescaled to max |w_i| = 1, and their common factor.
+        The node differences are scaled by c = 4 / (max(x) - min(x)) to keep the
+        products from overflowing or underflowing for large n.
+        """
+
+        x_data = self.x_data
+        span = np.ptp(x_data) if len(x_data) > 1 else 1.0
+        c = 4 / span if span > 0 else 1.0
+
+        diff = c * (x_data[:, np.newaxis] - x_data[np.newaxis, :])
+        np.fill_diagonal(diff, 1)
+
+        if np.any(diff == 0):
+            raise ZeroDivisionError("X array has indistinct points")
+
+        weights = 1 / np.prod(diff, axis = 1)
+        weights /= np.max(np.abs(weights))
+
+        return (weights,) + self._factor(weights, x_data)
+
+    @staticmethod
+    def _factor(weights, x_data):
+        """
+        Sign and log magnitude of the common factor s such that weights = s * w, from
+        the first node: s = weights_0 * prod_{j != 0} (x0 - xj).
+        """
+
+        d = x_data[0] - x_data[1:]
+        sign = np.sign(weights[0]) * np.prod(np.sign(d))
+        log_factor = np.log(np.abs(weights[0])) + np.sum(np.log(np.abs(d)))
+
+        return sign, log_factor
+
+    def add_point(self, x_new: float, y_new: float):
+        """
+        Append the node (x_new, f(x_new)), updating the weights in O(n).
+
+        Parameters
+        ----------
+        x_new : float
+            New node, distinct from x0, x1,..., xn
+        y_new : float
+            f(x_new)
+        """
+
+        weights, sign, log_factor = self._state()
+        d = self.x_data - x_new
+
+        if np.any(d == 0):
+            raise ZeroDivisionError("X array has indistinct points")
+
+        # w_i <- w_i / (xi - x_new) keeps the common factor; the new weight
+        # s / prod_j (x_new - xj) is formed in logs
+        weights = weights / d
+        scale = np.max(np.abs(weights))
+        weights /= scale
+        log_factor -= np.log(scale)
+
+        w_new = sign * np.prod(np.sign(-d)) * np.exp(log_factor - np.sum(np.log(np.abs(d))))
+
+        if abs(w_new) > 1:
+            weights /= abs(w_new)
+            log_factor -= np.log(abs(w_new))
+            w_new = np.sign(w_new)
+
+        self._x_data = self._freeze(np.append(self.x_data, x_new))
+        self._y_data = self._freeze(np.append(self.y_data, y_new))
+        self._cache = (np.append(weights, w_new), sign, log_factor)
+
+    def extend(self, x_new, y_new):
+        """
+        Append several nodes, one `add_point` at a time.
+
+        Parameters
+        ----------
+        x_new : array_like
+            New nodes
+        y_new : array_like
+            f evaluated at the new nodes
+        """
+
+        for x_i, y_i in zip(np.ravel(x_new), np.ravel(y_new)):
+            self.add_point(x_i, y_i)
+
+    def poly(self, symbolic = False):
+        """
+        Interpolating polynomial in the monomial basis, sum_i f(xi) L_i(x).
+
+        Parameters
+        ----------
+        symbolic : bool (optional)
+            Return a SymPy expression instead of a np.Polynomial
+
+        Returns
+        -------
+        polynomial : np.Polynomial or sympy.Expr
+        """
+
+        weights, sign, log_factor = self._state()
+        x_data = self.x_data
+        n = len(x_data)
+
+        # True weights are weights / factor
+        scale = sign * np.exp(- log_factor)
+
+        coef = np.zeros(n)
+
+        for i in range(n):
+            basis = P.fromroots(np.delete(x_data, i)).coef
+            coef += (self.y_data[i] * weights[i] * scale) * basis
+
+        return self._output(coef, symbolic)
@@ -1,6 +1,4 @@
-from numpy.polynomial import Polynomial as P
 import numpy as np
-import sympy
 from interpolate.interpolate_base import ABCInterpolate
 
 class Hermite(ABCInterpolate):
@@ -8,6 +6,15 @@ class Hermite(ABCInterpolate):
     def __init__(self, x_data, y_data, y_prime):
         self.y_prime = y_prime
         super().__init__(x_data, y_data)
+
+    @property
+    def y_prime(self):
+        return self._y_prime
+
+    @y_prime.setter
+    def y_prime(self, value):
+        self._y_prime = self._freeze(np.array(value, dtype = float))
+        self._cache = None
             
 
     def fit(self, eval):
@@ -26,80 +33,62 @@ class Hermite(ABCInterpolate):
             numbers f(x0), f(x1),..., f(xn)
         y_prime : array_like
             numbers f'(x0), f'(x1),..., f'(xn)
-        val : float 
-            point where polynomial P is to approximated
+        eval : float or array_like
+            point(s) where polynomial P is to approximated
 
         Returns
         -------
-        P(val) : float
-            Polynomial P evaluated at `val`
-        polynomial : np.Polynomial
-            Polynomial.
+        P(eval) : float or np.ndarray
+            Polynomial P evaluated at `eval`, with the same shape as `eval`
         """
 
-        n = len(self.x_data)
-        z = np.zeros((2 * n))
-        Q = np.zeros((2 * n, 2 * n))
-
-        for i in range(n):
-            # Divided Difference method
-            z[2*i] = self.x_data[i]
-            z[2*i + 1] = self.x_data[i]
-            Q[2*i, 0] = self.y_data[i]
-            Q[2*i + 1, 0] = self.y_data[i]
-            Q[2*i + 1, 1] = self.y_prime[i]
+        z, coef = self._state()
+        n = len(coef) - 1
 
-            if i != 0:
-                Q[2*i, 1] = (Q[2*i, 0] - Q[2*i - 1, 0]) / (z[2*i] - z[2*i-1])
+        def kernel(points):
+            p = np.full(points.shape, coef[n])
 
-        for i in range(2, 2*n):
-            for j in range(2, i+1):
-                Q[i, j] = (Q[i, j-1] - Q[i-1, j-1]) / (z[i] - z[i-j])
-                
-        n = int(len(z)/2)
-        hermite_poly = Q[0, 0]
+            for k in range(1, n+1):
+                p = coef[n - k] + ((points - z[n - k]) * p)
 
-        for i in range(1, 2 * n):
-            d = 1
-            for j in range(i):
-                d = d * (eval - z[j])
+            return p
 
-            hermite_poly += d * Q[i, i]
-        return hermite_poly
+        return self._evaluate(eval, kernel)
 
-    
-    def poly(self):
-
-        n = len(self.x_data)
-        z = np.zeros((2 * n))
-        Q = np.zeros((2 * n, 2 * n))
-
-        for i in range(n):
-            # Divided Difference method
-            z[2*i] = self.x_data[i]
-            z[2*i + 1] = self.x_data[i]
-            Q[2*i, 0] = self.y_data[i]
-            Q[2*i + 1, 0] = self.y_data[i]
-            Q[2*i + 1, 1] = self.y_prime[i]
+    def _prepare(self):
+        """
+        Nodes z0, z1,..., z_{2n+1} (each xi repeated twice) and the diagonal
+        Q[0, 0], Q[1, 1],..., Q[2n+1, 2n+1] of the Hermite divided difference table.
+        """
 
-            if i != 0:
-                Q[2*i, 1] = (Q[2*i, 0] - Q[2*i - 1, 0]) / (z[2*i] - z[2*i-1])
+        z = np.repeat(self.x_data, 2)
+        size = len(z)
 
-        for i in range(2, 2*n):
-            for j in range(2, i+1):
-                Q[i, j] = (Q[i, j-1] - Q[i-1, j-1]) / (z[i] - z[i-j])
-                
-        n = int(len(z)/2)
-        hermite_poly = Q[0, 0]
+        # Column 0 is f(z); column 1 uses f'(xi) where z[2i] == z[2i+1]
+        Q = np.repeat(self.y_data, 2)
+        Q_1 = np.empty(size - 1)
+        Q_1[0::2] = self.y_prime
+        Q_1[1::2] = (Q[2::2] - Q[1:-1:2]) / (z[2::2] - z[1:-1:2])
+        Q[1:] = Q_1
 
-        for i in range(1, 2 * n):
-            d = 1
-            for j in range(i):
-                d = d * (self.x - z[j])
+        # Column j overwrites rows j..2n+1
+        for j in range(2, size):
+            Q[j:] = (Q[j:] - Q[j-1:-1]) / (z[j:] - z[:size - j])
 
-            hermite_poly += d * Q[i, i]
+        return z, Q
 
-        coef = np.flip(np.asarray(sympy.Poly(hermite_poly).all_coeffs()))
+    def poly(self, symbolic = False):
+        """
+        Hermite polynomial, expanded from the Newton form on the nodes z0, z1,..., z_{2n+1}.
 
-        return P(coef)
+        Parameters
+        ----------
+        symbolic : bool (optional)
+            Return a SymPy expression instead of a np.Polynomial
 
+        Returns
+        -------
+        polynomial : np.Polynomial or sympy.Expr
+        """
+        z, coef = self._state()
+        return self._output(self._newton_to_monomial(coef, z), symbolic)
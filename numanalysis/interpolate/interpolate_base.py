@@ -1,26 +1,141 @@
 from abc import ABC, abstractmethod
-import sympy
+from numpy.polynomial import Polynomial as P
+import numpy as np
 
 class ABCInterpolate(ABC):
     """
-    An abstract interpolation class. 
+    An abstract interpolation class.
+
+    Node-dependent state (divided differences, weights, ...) is computed by
+    `_prepare` on first use and cached until `x_data` or `y_data` is reassigned.
+    The stored data arrays are read-only copies, so they cannot be changed in place
+    behind the cache.
     """
 
+    # Upper bound on the number of elements in the (points x nodes) work arrays
+    # built while evaluating a block of query points.
+    _block_elements = 2 ** 20
+
     def __init__(self, x_data, y_data):
 
+        self._cache = None
         self.x_data = x_data
         self.y_data = y_data
-        self.x = sympy.symbols("x")
         #self.poly = self._poly()
 
+    @property
+    def x(self):
+        """
+        SymPy symbol used for symbolic output, imported on first use.
+        """
+        import sympy
+
+        return sympy.symbols("x")
+
+    @property
+    def x_data(self):
+        return self._x_data
+
+    @x_data.setter
+    def x_data(self, value):
+        self._x_data = self._freeze(np.array(value, dtype = float))
+        self._cache = None
+
+    @property
+    def y_data(self):
+        return self._y_data
+
+    @y_data.setter
+    def y_data(self, value):
+        self._y_data = self._freeze(np.array(value, dtype = float))
+        self._cache = None
+
+    @staticmethod
+    def _freeze(array):
+        array.flags.writeable = False
+        return array
+
     @abstractmethod
     def fit(self, eval):
         pass
 
     @abstractmethod
-    def poly(self):
+    def poly(self, symbolic = False):
         pass
 
+    def _prepare(self):
+        """
+        Compute the node-dependent state of the interpolant. Subclasses override this;
+        the result is cached by `_state`.
+        """
+        return None
+
+    def _state(self):
+        """
+        Cached node-dependent state, recomputed only after the data changes.
+        """
+        if self._cache is None:
+            self._cache = self._prepare()
+
+        return self._cache
+
+    def _output(self, coef, symbolic):
+        """
+        Interpolating polynomial from its monomial coefficients c0, c1,..., cn.
+
+        Returns
+        -------
+        polynomial : np.Polynomial, or a SymPy expression in `self.x` if `symbolic`
+        """
+        if symbolic:
+            return sum(c * self.x ** i for i, c in enumerate(coef))
+
+        # Drop exactly-zero leading coefficients
+        return P(coef).trim()
+
+    @staticmethod
+    def _newton_to_monomial(coef, nodes):
+        """
+        Expand the Newton form
+        c0 + c1 (x - z0) + ... + cn (x - z0)...(x - z_{n-1})
+        into monomial coefficients with a nested (Horner) multiplication.
+        """
+        n = len(coef) - 1
+        monomial = np.zeros(n + 1)
+        monomial[0] = coef[n]
+
+        for k in range(1, n + 1):
+            # monomial <- coef[n - k] + (x - z_{n-k}) * monomial
+            monomial[1:k + 1] = monomial[:k] - nodes[n - k] * monomial[1:k + 1]
+            monomial[0] = coef[n - k] - nodes[n - k] * monomial[0]
+
+        return monomial
+
+    def _evaluate(self, eval, kernel):
+        """
+        Evaluate `kernel` at the query point(s) `eval`.
+
+        Parameters
+        ----------
+        eval : float or array_like
+            Point(s) where the interpolating polynomial is evaluated.
+        kernel : callable
+            Maps a 1-D float array of points to the array of polynomial values.
+
+        Returns
+        -------
+        P(eval) : float or np.ndarray
+            A scalar for scalar input, otherwise an array of the same shape as `eval`.
+        """
+        points = np.asarray(eval, dtype=float)
+        flat = points.ravel()
+
+        # Split large inputs into blocks to bound the memory of the work arrays
+        block = max(1, self._block_elements // max(len(self.x_data), 1))
+        values = np.concatenate([kernel(flat[start:start + block])
+                                 for start in range(0, flat.size, block)] or [np.empty(0)])
 
-    
+        if points.ndim == 0:
+            return values[0]
 
+        return values.reshape(points.shape)
@@ -1,6 +1,5 @@
 from numpy.polynomial import Polynomial as P
 import numpy as np
-import sympy
 from interpolate.interpolate_base import ABCInterpolate
 
 class Lagrange(ABCInterpolate):
@@ -15,50 +14,80 @@ class Lagrange(ABCInterpolate):
         
 
     def fit(self, eval):
+        """
+        Lagrange Interpolation Method.
+        Evaluate the interpolating polynomial P on n+1 distinct numbers x0,...,xn
+        using the Lagrange basis polynomials L_i(x) = prod_{j != i} (x - xj) / (xi - xj).
+
+        Parameters:
+        -----------
+        eval : float or array_like
+            point(s) where polynomial P is to approximated
+
+        Returns
+        -------
+        P(eval) : float or np.ndarray
+            Polynomial P evaluated at `eval`, with the same shape as `eval`
+        """
 
-        evaluated_poly = 0
-
-        for i in range(len(self.x_data)):
-            product = 1
+        x_data = self.x_data
+        weights, c = self._state()
 
-            for j in range(len(self.x_data)):
+        def kernel(points):
+            # Scaled by the same c as the weights, so the factors c^(n-1) cancel
+            d = c * (points[:, np.newaxis] - x_data[np.newaxis, :])
 
-                if i != j:
-                    if  self.x_data[j] == self.x_data[i]:
-                        raise ZeroDivisionError("X array has indistinct points")
-                
-                    product *= ((eval - self.x_data[j]) / (self.x_data[i] - self.x_data[j]))
+            # prod_{j != i} (x - xj) as the product of the prefix and suffix products
+            left = np.ones_like(d)
+            right = np.ones_like(d)
+            left[:, 1:] = np.cumprod(d[:, :-1], axis = 1)
+            right[:, :-1] = np.cumprod(d[:, :0:-1], axis = 1)[:, ::-1]
 
-                else:
-                    continue
-            
-            evaluated_poly += (product * self.y_data[i]) 
+            return (left * right * weights) @ self.y_data
 
-        return evaluated_poly
+        return self._evaluate(eval, kernel)
 
-    def poly(self):
+    def _prepare(self):
         """
-        Symbolic Representation of polynomial
+        Weights w_i = 1 / prod_{j != i} c (xi - xj), which only depend on the nodes,
+        and the scale factor c. Scaling by c = 4 / (max(x) - min(x)) keeps the
+        products of differences from overflowing or underflowing for large n.
         """
-        poly = 0
 
-        for i in range(len(self.x_data)):
-            product = 1
+        x_data = self.x_data
+        span = np.ptp(x_data) if len(x_data) > 1 else 1.0
+        c = 4 / span if span > 0 else 1.0
 
-            for j in range(len(self.x_data)):
+        diff = c * (x_data[:, np.newaxis] - x_data[np.newaxis, :])
+        np.fill_diagonal(diff, 1)
 
-                if i != j:
-                    if  self.x_data[j] == self.x_data[i]:
-                        raise ZeroDivisionError("X array has indistinct points")
-                
-                    product *= ((self.x - self.x_data[j]) / (self.x_data[i] - self.x_data[j]))
+        if np.any(diff == 0):
+            raise ZeroDivisionError("X array has indistinct points")
 
-                else:
-                    continue
-            
-            poly += (product * self.y_data[i])
-        
-        # Convert Sympy polynomial into Numpy Polynomial
+        return 1 / np.prod(diff, axis = 1), c
+
+    def poly(self, symbolic = False):
+        """
+        Interpolating polynomial sum_i f(xi) L_i(x), built with NumPy polynomial arithmetic.
+
+        Parameters
+        ----------
+        symbolic : bool (optional)
+            Return a SymPy expression instead of a np.Polynomial
+
+        Returns
+        -------
+        polynomial : np.Polynomial or sympy.Expr
+        """
+        weights, c = self._state()
+        n = len(self.x_data)
+
+        # True weights are weights * c^(n-1)
+        weights = weights * c ** (n - 1)
+        coef = np.zeros(n)
+
+        for i in range(n):
+            basis = P.fromroots(np.delete(self.x_data, i)).coef
+            coef += (weights[i] * self.y_data[i]) * basis
 
-        coefs = np.flip(np.asarray(sympy.Poly(poly).all_coeffs())) # extract coefficients
-        return P(coefs)
\ No newline at end of file
+        return self._output(coef, symbolic)
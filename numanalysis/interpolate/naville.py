@@ -1,7 +1,4 @@
-from numpy.polynomial import Polynomial as P
 import numpy as np
-import sympy
-import pandas as pd
 from interpolate.interpolate_base import ABCInterpolate
 
 class Naville(ABCInterpolate):
@@ -22,44 +19,71 @@ class Naville(ABCInterpolate):
             numbers x0, x1,..., xn
         y_data : array_like
             numbers f(x0), f(x1), ..., f(xn)
-        val : float 
-            point where polynomial P is to approximated
+        eval : float or array_like
+            point(s) where polynomial P is to approximated
 
         Returns
         -------
-
-        polynomial : np.Polynomial
-            Polynomial.
+        P(eval) : float or np.ndarray
+            Polynomial P evaluated at `eval`, with the same shape as `eval`
         """
-        data_len = len(self.x_data)
-        naville_table = np.empty((data_len,data_len))
-        naville_table[:, 0] = self.y_data
+        x_data = self.x_data
+        data_len = len(x_data)
+
+        def kernel(points):
+            # Only the latest column of the iteration table is kept, one row per node
+            naville_table = np.empty((data_len, len(points)))
+            naville_table[:, :] = self.y_data[:, np.newaxis]
 
-        for i in range(1,data_len):
+            for i in range(1, data_len):
 
-            for j in range(i, data_len):
+                x_j = x_data[i:, np.newaxis]
+                x_ji = x_data[:data_len - i, np.newaxis]
 
                 # Iteration Table
-                naville_table[j,i] = ((eval - self.x_data[j-i]) * naville_table[j,i - 1] - \
-                                        (eval - self.x_data[j]) * naville_table[j-1,i-1]) / (self.x_data[j] - self.x_data[j-i])
+                naville_table[i:] = ((points - x_ji) * naville_table[i:] - \
+                                     (points - x_j) * naville_table[i - 1:-1]) / (x_j - x_ji)
+
+            return naville_table[data_len - 1]
+
+        return self._evaluate(eval, kernel)
+
+    def poly(self, symbolic = False):
+        """
+        Interpolating polynomial from Naville's iteration table, where every
+        entry of the table is kept as a vector of monomial coefficients.
 
-        return naville_table[data_len-1,data_len-1]
+        Parameters
+        ----------
+        symbolic : bool (optional)
+            Return a SymPy expression instead of a np.Polynomial
 
-    def poly(self):
+        Returns
+        -------
+        polynomial : np.Polynomial or sympy.Expr
+        """
+        x_data = self.x_data
+        data_len = len(x_data)
 
-        data_len = len(self.x_data)
-        naville_pd = pd.DataFrame(np.empty((data_len, data_len)))
-        naville_pd.iloc[:, 0] = self.y_data
+        # Row j holds the coefficients of the latest polynomial through x_{j-i},..., x_j
+        naville_table = np.zeros((data_len, data_len))
+        naville_table[:, 0] = self.y_data
 
-        for i in range(1,data_len):
+        for i in range(1, data_len):
 
-            for j in range(i, data_len):
+            x_j = x_data[i:, np.newaxis]
+            x_ji = x_data[:data_len - i, np.newaxis]
+            upper = naville_table[i:]
+            lower = naville_table[i - 1:-1]
 
-                # Iteration Table
-                naville_pd.iloc[j,i] = ((self.x - self.x_data[j-i]) * sympy.sympify(naville_pd.iloc[j,i - 1]) - \
-                                        (self.x - self.x_data[j]) * sympy.sympify(naville_pd.iloc[j-1,i-1])) / (self.x_data[j] - self.x_data[j-i])
+            # x * Q(x) shifts the coefficients up by one degree
+            x_upper = np.zeros_like(upper)
+            x_lower = np.zeros_like(lower)
+            x_upper[:, 1:] = upper[:, :-1]
+            x_lower[:, 1:] = lower[:, :-1]
 
-        poly = naville_pd.iloc[data_len-1,data_len-1]
-        coef = np.flip(np.asarray(sympy.Poly(poly).all_coeffs()))
+            # Iteration Table
+            naville_table[i:] = ((x_upper - x_ji * upper) - \
+                                 (x_lower - x_j * lower)) / (x_j - x_ji)
 
-        return P(coef)
\ No newline at end of file
+        return self._output(naville_table[data_len - 1], symbolic)
@@ -1,84 +1,161 @@
-from numpy.polynomial import Polynomial as P
 import numpy as np
-import sympy
 from interpolate.interpolate_base import ABCInterpolate
 
 class NewtonDivDiff(ABCInterpolate):
 
-    def __init__(self, x_data, y_data):
+    """
+    Newton's Divided Difference Method.
+
+    Only the last row of the divided difference table,
+    f[xn], f[x_{n-1}, xn],..., f[x0,..., xn], is kept. These are the coefficients of
+    the Newton form taken with the nodes in reverse order, xn, x_{n-1},..., x0, so a
+    new node is appended in O(n) time and memory (`add_point`), and the oldest node
+    is dropped by truncating the last coefficient.
+
+    Parameters
+    ----------
+    x_data : array_like
+        numbers x0, x1,..., xn
+    y_data : array_like
+        numbers f(x0), f(x1), ..., f(xn)
+    window : int (optional)
+        Keep only the `window` most recent nodes, for online resampling
+    """
+
+    def __init__(self, x_data, y_data, window = None):
+
+        if window is not None:
+            if window < 1:
+                raise ValueError("window should be atleast 1")
+
+            x_data = np.asarray(x_data)[-window:]
+            y_data = np.asarray(y_data)[-window:]
+
+        self.window = window
         super().__init__(x_data, y_data)
-            
+
     def fit(self, eval):
         """
-        Newton's Divided Difference Method. 
+        Newton's Divided Difference Method.
         Extension of Naville's method but this is used to successively generate polynomials.
-        
+
         Parameters:
         -----------
         x_data : array_like
             numbers x0, x1,..., xn
         y_data : array_like
             numbers f(x0), f(x1), ..., f(xn)
-        val : float 
-            point where polynomial P is to approximated
+        eval : float or array_like
+            point(s) where polynomial P is to approximated
 
         Returns
         -------
-        P(val): float
-            Polynomial evaluated at `val`
-        polynomial : np.Polynomial
-            Polynomial.
+        P(eval): float or np.ndarray
+            Polynomial evaluated at `eval`, with the same shape as `eval`
         """
 
-        data_len = len(self.x_data)
-        coef = np.zeros(data_len)
-        F = np.zeros([data_len, data_len])
+        coef = self._state()
+        nodes = self.x_data[::-1]
+        n = len(coef) - 1
+
+        def kernel(points):
+            p = np.full(points.shape, coef[n])
+
+            for k in range(1, n+1):
+                p = coef[n - k] + ((points - nodes[n - k]) * p)
+
+            return p
 
-        # First column of matrix F is f(x0),f(x1),...,f(xn)
-        F[:, 0] = self.y_data 
+        return self._evaluate(eval, kernel)
+
+    def _prepare(self):
+        """
+        Last row f[xn], f[x_{n-1}, xn],..., f[x0,..., xn] of the divided difference table.
+        """
+
+        x_data = self.x_data
+        data_len = len(x_data)
+        last_row = np.empty(data_len)
+
+        # First column of the table is f(x0),f(x1),...,f(xn); column j overwrites rows j..n
+        F = np.array(self.y_data, dtype = float)
+
+        if data_len:
+            last_row[0] = F[-1]
 
         for j in range(1, data_len):
+            F[j:] = (F[j:] - F[j-1:-1]) / (x_data[j:] - x_data[:data_len - j])
+            last_row[j] = F[-1]
 
-            for i in range(j, data_len):
+        return last_row
 
-                F[i, j] = (F[i, j-1] - F[i-1, j-1]) / (self.x_data[i] - self.x_data[i-j])
+    def add_point(self, x_new: float, y_new: float):
+        """
+        Append the node (x_new, f(x_new)) in O(n), without rebuilding the table.
+        With a `window`, the oldest node is dropped once the window is full.
+
+        Parameters
+        ----------
+        x_new : float
+            New node, distinct from x0, x1,..., xn
+        y_new : float
+            f(x_new)
+        """
 
-        # Diagonals of matrix F
-        for i in range(0, data_len):
-            coef[i] = F[i,i]
+        last_row = self._state()
+        nodes = self.x_data[::-1]
 
-        n = len(coef) - 1
-        p = coef[n]
+        if np.any(nodes == x_new):
+            raise ZeroDivisionError("X array has indistinct points")
 
-        for k in range(1, n+1):
-            p = coef[n - k] + ((eval - self.x_data[n - k]) * p)
-            
-        return p
+        # f[x_{n+1-k},..., x_new] from f[x_{n+2-k},..., x_new] and f[x_{n+1-k},..., xn]
+        new_row = np.empty(len(last_row) + 1)
+        new_row[0] = y_new
 
-    def poly(self):
+        for k in range(1, len(new_row)):
+            new_row[k] = (new_row[k-1] - last_row[k-1]) / (x_new - nodes[k-1])
 
-        data_len = len(self.x_data)
-        coef = np.zeros(data_len)
-        F = np.zeros([data_len, data_len])
+        x_data = np.append(self.x_data, x_new)
+        y_data = np.append(self.y_data, y_new)
 
-        # First column of matrix F is f(x0),f(x1),...,f(xn)
-        F[:, 0] = self.y_data 
+        if self.window is not None and len(x_data) > self.window:
+            # Dropping x0 truncates the reverse-order Newton form
+            x_data = x_data[1:]
+            y_data = y_data[1:]
+            new_row = new_row[:-1]
 
-        for j in range(1, data_len):
+        self._x_data = self._freeze(x_data)
+        self._y_data = self._freeze(y_data)
+        self._cache = new_row
 
-            for i in range(j, data_len):
+    def extend(self, x_new, y_new):
+        """
+        Append several nodes, one `add_point` at a time.
+
+        Parameters
+        ----------
+        x_new : array_like
+            New nodes
+        y_new : array_like
+            f evaluated at the new nodes
+        """
 
-                F[i, j] = (F[i, j-1] - F[i-1, j-1]) / (self.x_data[i] - self.x_data[i-j])
+        for x_i, y_i in zip(np.ravel(x_new), np.ravel(y_new)):
+            self.add_point(x_i, y_i)
 
-        # Diagonals of matrix F
-        for i in range(0, data_len):
-            coef[i] = F[i,i]
+    def poly(self, symbolic = False):
+        """
+        Interpolating polynomial, expanded from the Newton form with the cached
+        divided differences.
 
-        n = len(coef) - 1
-        p = coef[n]
+        Parameters
+        ----------
+        symbolic : bool (optional)
+            Return a SymPy expression instead of a np.Polynomial
 
-        for k in range(1, n+1):
-            p = coef[n - k] + ((self.x - self.x_data[n - k]) * p)
-            
-        coef = np.flip(np.asarray(sympy.Poly(p).all_coeffs()))
-        return P(coef)
\ No newline at end of file
+        Returns
+        -------
+        polynomial : np.Polynomial or sympy.Expr
+        """
+        coef = self._newton_to_monomial(self._state(), self.x_data[::-1])
+        return self._output(coef, symbolic)
@@ -1,2 +1,7 @@
 from .ols import OLS
-from .poly_regression import PLS
\ No newline at end of file
+from .poly_regression import PLS
+from .nonlinear import NonlinearLS
+from .orthogonal import OrthogonalBasis
+from .recursive import RecursiveLeastSquares
+from .sparse import CSRMatrix
+from .solver import lstsq, vandermonde
@@ -0,0 +1,211 @@
+import numpy as np
+
+
+def _exp(x, b, a):
+    return b * np.exp(a * x)
+
+
+def _exp_jacobian(x, b, a):
+    e = np.exp(a * x)
+    return e, b * x * e
+
+
+def _power(x, b, a):
+    return b * np.power(x, a)
+
+
+def _power_jacobian(x, b, a):
+    xa = np.power(x, a)
+    return xa, b * xa * np.log(x)
+
+
+# Built-in models y = f(x, b, a) and their analytic Jacobians
+MODELS = {
+    "exp": (_exp, _exp_jacobian),
+    "power": (_power, _power_jacobian),
+}
+
+
+class NonlinearLS:
+
+    r'''
+    Nonlinear least squares fit of a model y = f(x, \theta_1, ..., \theta_p) + \epsilon
+    with the Levenberg-Marquardt method.
+
+    Every iteration solves the damped Gauss-Newton system
+    (J^T J + \lambda diag(J^T J)) \delta = - J^T r
+    for the residuals r = f(x, \theta) - y and the Jacobian J. The step is accepted and
+    \lambda decreased if it lowers the sum of squares, and \lambda is increased otherwise.
+
+    Several series sampled on the same x (y_data of shape (n, m)) are m independent
+    problems, iterated in lock-step: the models are evaluated once for all active
+    problems and the p x p systems are solved as one batch.
+
+    Parameters
+    ----------
+    x_data : array_like[float]
+        Values of the independent variable
+    y_data : array_like[float]
+        Values of the dependent variable, (n,) or (n, m) for m series
+
+    Reference:
+    Marquardt, D. W. (1963). An Algorithm for Least-Squares Estimation of Nonlinear
+    Parameters. Journal of the SIAM, 11(2), 431-441.
+    '''
+
+    def __init__(self, x_data, y_data):
+        self.x_data = x_data
+        self.y_data = y_data
+
+    def _jacobian(self, model, x, params, derivative):
+        '''
+        (B, n, p) Jacobian of the model by complex step or forward differences.
+        '''
+        B, p = params.shape
+        J = np.empty((B, len(x), p))
+
+        for j in range(p):
+
+            if derivative == "complex_step":
+                h = 1e-20
+                shifted = params.astype(complex)
+                shifted[:, j] += 1j * h
+                J[..., j] = np.imag(self._evaluate(model, x, shifted)) / h
+
+            else:
+                h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(params[:, j]), 1)
+                shifted = params.copy()
+                shifted[:, j] += h
+                J[..., j] = (self._evaluate(model, x, shifted) - self._evaluate(model, x, params)) / h[:, np.newaxis]
+
+        return J
+
+    @staticmethod
+    def _evaluate(model, x, params):
+        '''
+        Model at the (B, p) parameters: every parameter is passed as a (B, 1) column,
+        which broadcasts against x to a (B, n) array.
+        '''
+        columns = [params[:, j:j + 1] for j in range(params.shape[1])]
+        return np.broadcast_to(model(x, *columns), (len(params), len(x)))
+
+    def fit(self, model, p0, jacobian = None, derivative = "complex_step", tolerance = 1e-10,
+            max_iter = 100, damping = 1e-3, full_output = False):
+        r'''
+        Parameters
+        ----------
+        model : str or callable
+            "exp" (y = b * exp(a * x)), "power" (y = b * x ** a), both with parameters (b, a)
+            and analytic Jacobians, or a vectorized callable f(x, *params)
+        p0 : array_like
+            (p,) initial parameters shared by all series, or (m, p) for every series
+        jacobian : callable (optional)
+            Partial derivatives of a callable model, jacobian(x, *params) -> sequence of p arrays.
+            If omitted, they are computed with `derivative`.
+        derivative : str (optional)
+            "complex_step" (exact for complex-safe models) or "forward" (forward differences)
+        tolerance : float (optional)
+            Acceptable relative change of the parameters and of the sum of squares
+        max_iter : int (optional)
+            Maximum number of iterations
+        damping : float (optional)
+            Initial Levenberg-Marquardt parameter \lambda
+        full_output : bool (optional)
+            Also return the mean squared error, the iterations and the convergence of every series
+
+        Returns
+        -------
+        params : np.ndarray
+            (p,) fitted parameters, or (m, p) for m series
+        error : float or np.ndarray
+            Mean squared error, only if `full_output`
+        iterations : int or np.ndarray
+            Number of iterations, only if `full_output`
+        converged : bool or np.ndarray
+            Whether the tolerance was reached, only if `full_output`
+        '''
+        if isinstance(model, str):
+            if model not in MODELS:
+                raise ValueError("Invalid model. Choose from: ['exp', 'power'] or a callable")
+
+            model, jacobian = MODELS[model]
+
+        if derivative not in ("complex_step", "forward"):
+            raise ValueError("Invalid derivative. Choose from: ['complex_step', 'forward']")
+
+        x = np.asarray(self.x_data, dtype = float)
+        y = np.asarray(self.y_data, dtype = float)
+        single = y.ndim == 1
+        Y = y[:, np.newaxis] if single else y
+        m = Y.shape[1]
+        Y = Y.T
+
+        params = np.array(np.broadcast_to(np.asarray(p0, dtype = float), (m, np.shape(p0)[-1])))
+        lam = np.full(m, float(damping))
+        residual = self._evaluate(model, x, params) - Y
+        cost = np.sum(np.square(residual), axis = 1)
+
+        iterations = np.zeros(m, dtype = int)
+        converged = np.zeros(m, dtype = bool)
+        active = np.arange(m)
+        iter = 0
+
+        while active.size and iter < max_iter:
+
+            if jacobian is None:
+                J = self._jacobian(model, x, params[active], derivative)
+
+            else:
+                columns = [params[active, j:j + 1] for j in range(params.shape[1])]
+                J = np.stack([np.broadcast_to(d, (len(active), len(x))) for d in jacobian(x, *columns)], axis = -1)
+
+            # Damped normal equations of all active problems
+            gradient = np.einsum("bnp,bn->bp", J, residual[active])
+            A = np.einsum("bnp,bnq->bpq", J, J)
+            diag = np.diagonal(A, axis1 = 1, axis2 = 2).copy()
+            diag[diag == 0] = 1
+
+            while True:
+                system = A + (lam[active, np.newaxis] * diag)[:, :, np.newaxis] * np.eye(A.shape[1])
+                step = - np.linalg.solve(system, gradient[:, :, np.newaxis])[:, :, 0]
+
+                trial = params[active] + step
+
+                with np.errstate(all = "ignore"):
+                    trial_residual = self._evaluate(model, x, trial) - Y[active]
+                    trial_cost = np.sum(np.square(trial_residual), axis = 1)
+
+                better = trial_cost <= cost[active]
+
+                # Problems whose steps increase the cost retry with more damping
+                if better.all() or np.all(lam[active[~better]] > 1e16):
+                    break
+
+                lam[active[~better]] *= 10
+
+            accepted = active[better]
+            params[accepted] = trial[better]
+            decrease = cost[accepted] - trial_cost[better]
+            cost[accepted] = trial_cost[better]
+            residual[accepted] = trial_residual[better]
+            lam[accepted] /= 10
+            iterations[active] += 1
+
+            small_step = np.linalg.norm(step, axis = 1) <= tolerance * (np.linalg.norm(params[active], axis = 1) + tolerance)
+            small_decrease = np.zeros(len(active), dtype = bool)
+            small_decrease[better] = decrease <= tolerance * (cost[accepted] + tolerance)
+
+            done = better & (small_step | small_decrease)
+            converged[active[done]] = True
+            active = active[~done & (lam[active] <= 1e16)]
+            iter += 1
+
+        error = cost / len(x)
+
+        if single:
+            params, error, iterations, converged = params[0], float(error[0]), int(iterations[0]), bool(converged[0])
+
+        if full_output:
+            return params, error, iterations, converged
+
+        return params
@@ -1,4 +1,8 @@
 import numpy as np
+from least_squares.nonlinear import MODELS, NonlinearLS
+from least_squares.recursive import RecursiveLeastSquares
+from least_squares.solver import QR_BLOCK_ROWS, QRAccumulator, iter_chunks, lstsq, vandermonde
+from least_squares import sparse
 
 class OLS:
 
@@ -14,22 +18,43 @@ class OLS:
     -----------
 
     x_data : array_like[float]
-        Values of the independent variable
+        Values of the independent variable, or a (n, k) design of k regressors (dense,
+        `least_squares.sparse.CSRMatrix` or `scipy.sparse.csr_matrix`) for the linear formula
     y_data : array_like[float]
-        Values of the dependent variable
+        Values of the dependent variable, (n,) or (n, m) for m series fitted at once
     formula: str['linear', 'exp', 'power']
         Type of formula to model the relationship between X and Y
+    method: str['auto', 'cholesky', 'qr', 'svd', 'lsqr', 'cgls']
+        Least squares solver of the linear formula. The direct solvers are described in
+        `least_squares.solver.lstsq`. "lsqr" and "cgls" are matrix-free iterative solvers
+        (`least_squares.sparse.solve`), used by "auto" for sparse designs; the intercept
+        is handled by centering, so a sparse design is never densified.
+    damping: float
+        Ridge damping of the linear coefficients (not of the intercept)
+    precondition: bool
+        Jacobi preconditioning of the iterative solvers
+    tolerance: float
+        Relative tolerance of the iterative solvers
+    max_iter: int
+        Maximum number of iterations of the iterative solvers
 
     Returns
     -------
     pred : array_like
         predicted or fitted values \hat{y}
-    error : float
-        mean squared error
+    error : float or np.ndarray
+        mean squared error, of every series if y_data is (n, m)
+
+    The number of iterations of the iterative solvers is stored in `iterations`.
+    The exp and power formulas are fitted by nonlinear least squares
+    (`least_squares.nonlinear.NonlinearLS`), started from the linear fit of log(y).
+    The number of iterations, convergence and final mean squared error are
+    stored in `iterations`, `converged` and `cost`.
     '''
-    def __init__(self, x_data: np.ndarray, y_data: np.ndarray):
+    def __init__(self, x_data: np.ndarray = None, y_data: np.ndarray = None):
         self.x_data = x_data
         self.y_data = y_data
+        self._recursive = None
 
     def _mse(self, pred: np.ndarray) -> float:
         '''
@@ -50,36 +75,111 @@ class OLS:
         mse : float
             Mean Squared Error $\sum_i^n (y - \hat{y})^2 / n $
         '''
-        return np.square(np.subtract(self.y_data, pred)).mean()
+        return np.square(np.subtract(self.y_data, pred)).mean(axis = 0)
     
   
-    def fit(self, formula: str, show_coef = False):
+    def _log_linear(self, formula: str) -> np.ndarray:
+        '''
+        Starting parameters [b, a] from the linear fit of log(y) on x (exp) or on log(x) (power).
+        Series with non-positive values start from b = mean(y), a = 0.
+        '''
+        x = np.asarray(self.x_data, dtype = float)
+        y = np.asarray(self.y_data, dtype = float)
+        Y = y[:, np.newaxis] if y.ndim == 1 else y
+
+        p0 = np.zeros((Y.shape[1], 2))
+        p0[:, 0] = Y.mean(axis = 0)
+        valid = np.all(Y > 0, axis = 0)
+
+        if valid.any():
+            X = vandermonde(x if formula == 'exp' else np.log(x), 1)
+            fit = lstsq(X, np.log(Y[:, valid]))
+            p0[valid, 0] = np.exp(fit[0])
+            p0[valid, 1] = fit[1]
+
+        return p0[0] if y.ndim == 1 else p0
+
+    @staticmethod
+    def _design(x) -> np.ndarray:
+        '''
+        Column of 1's and the regressors: [1, x] for (n,) x, [1, X] for a (n, k) design.
+        '''
+        x = np.asarray(x, dtype = float)
+        return vandermonde(x, 1) if x.ndim == 1 else np.column_stack([np.ones(len(x)), x])
+
+    def _linear(self, method, damping, precondition, tolerance, max_iter):
+        '''
+        Intercept and coefficients [b_0, b_1, ..., b_k] of the linear formula, and predictions.
+        '''
+        X = self.x_data
+        y = np.asarray(self.y_data, dtype = float)
+
+        if method in ('lsqr', 'cgls') or (method == 'auto' and sparse.is_sparse(X)):
+            if sparse.is_sparse(X):
+                # Also used for the predictions, so any CSR-style object works
+                X = sparse.as_csr(X)
+
+            else:
+                X = np.asarray(X, dtype = float)
+                X = X[:, np.newaxis] if X.ndim == 1 else X
+
+            intercept, slopes, self.iterations = sparse.solve(X, y, 'lsqr' if method == 'auto' else method,
+                                                               damping, precondition, tolerance, max_iter)
 
-        n = len(self.x_data)
+            if slopes.ndim == 1:
+                pred = intercept + X @ slopes
 
-        # Column stack 1's and x values in a N x 2 matrix
-        X = np.c_[np.ones(n), self.x_data]
-        X_t = np.transpose(X)
-        A = np.linalg.inv(X_t @ X)
-        B = X_t @ self.y_data
+            else:
+                pred = intercept + np.column_stack([X @ slope for slope in slopes.T])
 
-        fit = A @ B
+            return np.vstack([intercept, slopes]) if slopes.ndim == 2 else np.append(intercept, slopes), pred
+
+        if sparse.is_sparse(X):
+            raise ValueError("Sparse designs require an iterative method: 'lsqr' or 'cgls'")
+
+        # Column stack 1's and x values in a N x (k + 1) matrix
+        design = self._design(X)
+        k = design.shape[1]
+
+        if damping:
+            # Ridge penalty as k - 1 extra rows damping * e_j, skipping the intercept
+            rows = damping * np.eye(k)[1:]
+            fit = lstsq(np.vstack([design, rows]), np.concatenate([y, np.zeros((k - 1,) + y.shape[1:])]), method)
+
+        else:
+            # All series share X: one factorization, (k + 1, m) coefficients
+            fit = lstsq(design, y, method)
+
+        return fit, design @ fit
+
+    def fit(self, formula: str, show_coef = False, method = "auto", damping = 0.0, precondition = True,
+            tolerance = 1e-10, max_iter = None):
 
         if formula == 'linear': # y = b + a * x
-            b = fit[0]
-            a = fit[1]
-            pred = a + b * self.x_data
-            
-        elif formula == 'exp': # y = b * exp(a * x)
-            b = np.exp(fit[0])
-            a = fit[1]
-            pred = b * np.exp(a * self.x_data)
-
-        elif formula == 'power': # y = b * x ** a
-            b = np.exp(fit[0])
-            a = fit[1]
-            pred = b * np.power(np.exp(self.x_data), a)
-        
+            fit, pred = self._linear(method, damping, precondition, tolerance, max_iter)
+            coef = list(fit)
+
+        elif formula in ('exp', 'power'): # y = b * exp(a * x), y = b * x ** a
+            x = np.asarray(self.x_data, dtype = float) if not sparse.is_sparse(self.x_data) else None
+
+            if x is None or x.ndim != 1:
+                raise ValueError("Exp and power formulas require a single regressor")
+
+            if formula == 'power' and np.any(x <= 0):
+                raise ValueError("Power formula requires positive x_data")
+
+            # Levenberg-Marquardt on the original data, started from the log-linear fit
+            fit, error, self.iterations, self.converged = NonlinearLS(x, self.y_data).fit(
+                formula, self._log_linear(formula), full_output = True)
+            self.cost = error
+            b, a = fit.T
+
+            if np.ndim(self.y_data) == 2:
+                x = x[:, np.newaxis]
+
+            pred = MODELS[formula][0](x, b, a)
+            coef = [b, a]
+
         else:
             raise NotImplementedError("Invalid Regression Formula! Please choose from linear, exp, or power")
 
@@ -87,9 +187,85 @@ class OLS:
 
         if show_coef:
 
-            coef = [b, a]
             return pred, error, coef
         
         else:
             return pred, error
-        
\ No newline at end of file
+
+    def fit_stream(self, formula = 'linear', chunks = None, chunk_size = QR_BLOCK_ROWS):
+        '''
+        Out-of-core linear fit, reading the data one block of rows at a time.
+        The R factor of [1, x, y] is updated block by block, so memory is
+        O(k^2 + chunk_size) for k regressors and the result matches
+        `fit('linear', method = "qr")`.
+
+        Parameters
+        ----------
+        formula : str['linear']
+            Only the linear formula can be accumulated over blocks
+        chunks : iterable of (x, y) (optional)
+            Blocks of rows, x of shape (b,) or (b, k). By default, `x_data` and `y_data` (e.g. `np.memmap`)
+            are read in blocks of `chunk_size` rows.
+        chunk_size : int (optional)
+            Rows per block when reading `x_data` and `y_data`
+
+        Returns
+        -------
+        coef : list
+            [b, a] of y = b + a * x, or [b_0, b_1, ..., b_k] for k regressors
+        error : float
+            mean squared error
+        '''
+        if formula != 'linear':
+            raise NotImplementedError("Invalid Regression Formula! Streaming fits support linear only")
+
+        if chunks is None:
+            chunks = iter_chunks(self.x_data, self.y_data, chunk_size)
+
+        accumulator = QRAccumulator()
+        k = None
+
+        for x, y in chunks:
+            design = self._design(x)
+            accumulator.update(design, y)
+            k = design.shape[1]
+
+        fit, error = accumulator.solve(k)
+
+        return list(fit), error
+
+    def partial_fit(self, x, y, forgetting = 1.0):
+        '''
+        Online linear fit: update the coefficients with new observations in O(k^2)
+        per sample for k regressors (recursive least squares), without refitting
+        the past data.
+
+        Parameters
+        ----------
+        x : float or array_like
+            New values of the independent variable, (b,) or (b, k) rows of k regressors
+        y : float or array_like
+            New values of the dependent variable, (b,) or (b, m) for m series
+        forgetting : float (optional)
+            Forgetting factor in (0, 1] to track drifting data, fixed by the first call
+
+        Returns
+        -------
+        coef : list
+            [b, a] of y = b + a * x, or [b_0, b_1, ..., b_k] for k regressors
+        error : float
+            Current (exponentially weighted) mean squared error
+        '''
+        if np.ndim(x) == 0:
+            # A single sample: one response, or one response per series
+            x, y = np.atleast_1d(x), np.asarray(y)[np.newaxis]
+
+        design = self._design(x)
+
+        if self._recursive is None:
+            self._recursive = RecursiveLeastSquares(design.shape[1], forgetting)
+
+        self._recursive.update(design, y)
+
+        return list(self._recursive.coef), self._recursive.mse
+
@@ -0,0 +1,138 @@
+import numpy as np
+from numpy.polynomial import Polynomial as P
+
+
+class OrthogonalBasis:
+
+    r'''
+    Polynomials orthogonal over the data points (Forsythe / Stieltjes).
+
+    With x mapped to t in [-1, 1], the monic polynomials p_j satisfy
+    \sum_i p_j(t_i) p_l(t_i) = 0 for j != l and the three-term recurrence
+
+    p_0 = 1, p_1 = (t - \alpha_0) p_0, p_{j+1} = (t - \alpha_j) p_j - \beta_j p_{j-1}
+    \alpha_j = <t p_j, p_j> / <p_j, p_j>, \beta_j = <p_j, p_j> / <p_{j-1}, p_{j-1}>
+
+    The least squares coefficient of p_j is <y, p_j> / <p_j, p_j> and does not depend on
+    the other basis polynomials, so raising the degree adds one column and one coefficient
+    in O(n) without refitting the lower terms.
+
+    Parameters
+    ----------
+    x_data : array_like[float]
+        Values of the independent variable
+
+    Reference:
+    Forsythe, G. E. (1957). Generation and Use of Orthogonal Polynomials for Data-Fitting
+    with a Digital Computer. Journal of the SIAM, 5(2), 74-88.
+    '''
+
+    def __init__(self, x_data):
+
+        x = np.asarray(x_data, dtype = float)
+        lower, upper = x.min(), x.max()
+
+        if lower == upper:
+            upper = lower + 1
+
+        self.domain = np.array([lower, upper])
+        self._t = (2 * x - (lower + upper)) / (upper - lower)
+
+        self.alpha = []
+        self.beta = []
+        self.norms = []
+        self.degree = -1
+        self._columns = []
+
+    def extend(self) -> np.ndarray:
+        '''
+        Next basis polynomial p_{degree + 1} at the data points.
+        '''
+        t = self._t
+
+        if self.degree == -1:
+            column = np.ones_like(t)
+
+        else:
+            current = self._columns[-1]
+            alpha = (t * current) @ current / self.norms[-1]
+            self.alpha.append(alpha)
+            column = (t - alpha) * current
+
+            if self.degree > 0:
+                beta = self.norms[-1] / self.norms[-2]
+                self.beta.append(beta)
+                column -= beta * self._columns[-2]
+
+        norm = column @ column
+
+        if norm <= np.finfo(float).eps * len(t) * (self.norms[-1] if self.norms else 1):
+            raise ValueError("Degree must be less than the number of distinct points")
+
+        self.norms.append(norm)
+        self._columns = self._columns[-1:] + [column]
+        self.degree += 1
+
+        return column
+
+    def evaluate(self, x, degree: int) -> np.ndarray:
+        '''
+        (len(x), degree + 1) matrix of the basis polynomials at new points x.
+        '''
+        if degree > self.degree:
+            raise ValueError(f"Basis only extends to degree {self.degree}")
+
+        lower, upper = self.domain
+        t = (2 * np.asarray(x, dtype = float) - (lower + upper)) / (upper - lower)
+        basis = np.empty((len(t), degree + 1))
+        basis[:, 0] = 1
+
+        for j in range(degree):
+            basis[:, j + 1] = (t - self.alpha[j]) * basis[:, j]
+
+            if j > 0:
+                basis[:, j + 1] -= self.beta[j - 1] * basis[:, j - 1]
+
+        return basis
+
+    def _polynomials(self, degree):
+        '''
+        Basis polynomials in t.
+        '''
+        polynomials = [P([1.0])]
+
+        for j in range(degree):
+            p = P([-self.alpha[j], 1]) * polynomials[-1]
+
+            if j > 0:
+                p = p - self.beta[j - 1] * polynomials[-2]
+
+            polynomials.append(p)
+
+        return polynomials
+
+    def polynomial(self, coef) -> P:
+        r'''
+        \sum_j coef_j p_j as a `Polynomial` in x. The coefficients are stored in t, with the
+        domain mapped to the window [-1, 1]; `.convert()` gives the monomial coefficients in x.
+        '''
+        coef = np.asarray(coef, dtype = float)
+        coef_t = np.zeros(len(coef))
+
+        for c, p in zip(coef, self._polynomials(len(coef) - 1)):
+            coef_t[:len(p.coef)] += c * p.coef
+
+        return P(coef_t, domain = self.domain, window = [-1, 1])
+
+    def to_monomial(self, degree: int) -> np.ndarray:
+        r'''
+        (degree + 1, degree + 1) matrix M such that M @ coef are the coefficients of
+        \sum_j coef_j p_j in the monomials 1, x, ..., x ** degree.
+        '''
+        M = np.zeros((degree + 1, degree + 1))
+
+        for j, p in enumerate(self._polynomials(degree)):
+            monomial = P(p.coef, domain = self.domain, window = [-1, 1]).convert().coef
+            M[:len(monomial), j] = monomial
+
+        return M
@@ -1,4 +1,7 @@
 import numpy as np
+from least_squares.orthogonal import OrthogonalBasis
+from least_squares.recursive import RecursiveLeastSquares
+from least_squares.solver import QR_BLOCK_ROWS, QRAccumulator, iter_chunks, lstsq, vandermonde
 
 class PLS:
 
@@ -14,21 +17,28 @@ class PLS:
     x_data : array_like[float]
         Values of the independent variable
     y_data : array_like[float]
-        Values of the dependent variable
+        Values of the dependent variable, (n,) or (n, m) for m series fitted at once
     degree: int
         Polynomial degree
+    method: str['auto', 'cholesky', 'qr', 'svd']
+        Least squares solver, see `least_squares.solver.lstsq`
+    basis: str['monomial', 'orthogonal']
+        "monomial" solves with the Vandermonde matrix. "orthogonal" fits in the basis
+        of polynomials orthogonal over x_data (`least_squares.orthogonal.OrthogonalBasis`),
+        which stays well conditioned at high degree; `method` is then not used.
 
     Returns
     -------
     pred : array_like
         predicted or fitted values \hat{y}
-    error : float
-        mean squared error
+    error : float or np.ndarray
+        mean squared error, of every series if y_data is (n, m)
     '''
 
-    def __init__(self, x_data, y_data):
+    def __init__(self, x_data = None, y_data = None):
         self.x_data = x_data
         self.y_data = y_data
+        self._recursive = None
 
     def _mse(self, pred: np.ndarray) -> float:
         '''
@@ -49,28 +59,26 @@ class PLS:
         mse : float
             Mean Squared Error $\sum_i^n (y - \hat{y})^2 / n $
         '''
-        return np.square(np.subtract(self.y_data, pred)).mean()
+        return np.square(np.subtract(self.y_data, pred)).mean(axis = 0)
 
-    def fit(self, degree: int, show_coef = False):
+    def fit(self, degree: int, show_coef = False, method = "auto", basis = "monomial"):
 
-        n = len(self.x_data)
-        X = [np.ones(n), self.x_data]
+        if basis == "orthogonal":
+            coef, errors, residual = self._orthogonal_path(degree)
+            pred = np.subtract(self.y_data, residual)
+
+            # Monomial coefficients, as for the Vandermonde fit
+            fit = self.basis.to_monomial(degree) @ coef
 
-        for i in range(2, degree + 1):
-            X_i = np.power(self.x_data, i)
-            X = np.append(X, [X_i], axis = 0)
-            
-        X = np.column_stack(X)
-        X_t = np.transpose(X)
-        A = np.linalg.inv(X_t @ X)
-        B = X_t @ self.y_data
+        elif basis == "monomial":
+            X = vandermonde(self.x_data, degree)
 
-        fit = A @ B 
+            # All series share X: one factorization, (degree + 1, m) coefficients
+            fit = lstsq(X, self.y_data, method)
+            pred = X @ fit
 
-        pred = fit[0] + fit[1] * self.x_data
-        for i in range(2, degree + 1):
-            val = fit[i] * np.power(self.x_data, i)
-            pred = pred + val
+        else:
+            raise ValueError("Invalid basis. Choose from: ['monomial', 'orthogonal']")
 
         error = self._mse(pred)
 
@@ -80,4 +88,191 @@ class PLS:
             return pred, error, coef
         
         else:
-            return pred, error
\ No newline at end of file
+            return pred, error
+
+    def _orthogonal_steps(self, max_degree: int):
+        '''
+        Fits of degree 0, 1, ..., max_degree in the orthogonal basis, one O(n) basis column
+        per degree: yields the basis column, its coefficient and the residual. The basis
+        is kept in `basis`.
+        '''
+        y = np.asarray(self.y_data, dtype = float)
+        residual = y.copy()
+        self.basis = OrthogonalBasis(self.x_data)
+
+        for _ in range(max_degree + 1):
+            column = self.basis.extend()
+
+            # Projection of the residual (modified Gram-Schmidt) equals the projection of y
+            c = column @ residual / self.basis.norms[-1]
+            residual -= column * c if y.ndim == 1 else np.outer(column, c)
+
+            yield column, c, residual
+
+    def _orthogonal_path(self, max_degree: int):
+        '''
+        Coefficients in the orthogonal basis and mean squared errors of every degree up to max_degree.
+        '''
+        coef, errors = [], []
+
+        for column, c, residual in self._orthogonal_steps(max_degree):
+            coef.append(c)
+            errors.append(np.square(residual).mean(axis = 0))
+
+        return np.array(coef), np.array(errors), residual
+
+    def fit_path(self, max_degree: int):
+        '''
+        Fits of every degree 0, 1, ..., max_degree in one pass over an orthogonal basis.
+        The coefficients of lower degrees do not change as the degree is raised, so the
+        whole path costs as much as a single fit of degree max_degree.
+
+        Parameters
+        ----------
+        max_degree : int
+            Highest polynomial degree
+
+        Returns
+        -------
+        errors : np.ndarray
+            (max_degree + 1,) mean squared error of every degree, (max_degree + 1, m) for m series
+        polynomials : list
+            Fitted `Polynomial` of every degree (a list of m polynomials per degree for m series)
+        '''
+        coef, errors, residual = self._orthogonal_path(max_degree)
+
+        if coef.ndim == 1:
+            polynomials = [self.basis.polynomial(coef[:d + 1]) for d in range(max_degree + 1)]
+
+        else:
+            polynomials = [[self.basis.polynomial(c) for c in coef[:d + 1].T] for d in range(max_degree + 1)]
+
+        return errors, polynomials
+
+    def select_degree(self, max_degree: int, criterion = "loocv"):
+        r'''
+        Degree selection over 0, 1, ..., max_degree without refitting.
+
+        Every score comes from the residuals r and the leverages h_i (diagonal of the hat
+        matrix) of the orthogonal path. In the orthogonal basis h_i = \sum_j p_j(x_i)^2 / <p_j, p_j>,
+        so raising the degree updates the leverages in O(n).
+
+        Parameters
+        ----------
+        max_degree : int
+            Highest polynomial degree
+        criterion : str (optional)
+            "loocv" - leave-one-out cross validation, \sum_i (r_i / (1 - h_i))^2 / n
+            "gcv"   - generalized cross validation, (\sum_i r_i^2 / n) / (1 - k / n)^2
+            "aic"   - Akaike information criterion, n log(\sum_i r_i^2 / n) + 2 k
+            "bic"   - Bayesian information criterion, n log(\sum_i r_i^2 / n) + k log(n)
+            with k = degree + 1 coefficients
+
+        Returns
+        -------
+        degree : int or np.ndarray
+            Degree with the lowest score (of every series for m series)
+        scores : np.ndarray
+            (max_degree + 1,) score of every degree, (max_degree + 1, m) for m series
+        '''
+        if criterion not in ("loocv", "gcv", "aic", "bic"):
+            raise ValueError("Invalid criterion. Choose from: ['loocv', 'gcv', 'aic', 'bic']")
+
+        n = len(self.x_data)
+        leverage = np.zeros(n)
+        scores = []
+
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+
+            for k, (column, c, residual) in enumerate(self._orthogonal_steps(max_degree), start = 1):
+                leverage += column ** 2 / self.basis.norms[-1]
+                mse = np.square(residual).mean(axis = 0)
+
+                if criterion == "loocv":
+                    deleted = residual / (1 - leverage if residual.ndim == 1 else (1 - leverage)[:, np.newaxis])
+                    scores.append(np.square(deleted).mean(axis = 0))
+
+                elif criterion == "gcv":
+                    scores.append(mse / (1 - k / n) ** 2 if k < n else np.inf * np.ones_like(mse))
+
+                elif criterion == "aic":
+                    scores.append(n * np.log(mse) + 2 * k)
+
+                else:
+                    scores.append(n * np.log(mse) + k * np.log(n))
+
+        scores = np.array(scores)
+        scores[np.isnan(scores)] = np.inf
+
+        return np.argmin(scores, axis = 0), scores
+
+    def fit_stream(self, degree: int, chunks = None, chunk_size = QR_BLOCK_ROWS):
+        '''
+        Out-of-core fit, reading the data one block of rows at a time.
+        The R factor of the Vandermonde matrix is updated block by block, so memory
+        is O(degree^2 + chunk_size) and the result matches `fit(degree, method = "qr")`.
+
+        Parameters
+        ----------
+        degree : int
+            Polynomial degree
+        chunks : iterable of (x, y) (optional)
+            Blocks of rows. By default, `x_data` and `y_data` (e.g. `np.memmap`)
+            are read in blocks of `chunk_size` rows.
+        chunk_size : int (optional)
+            Rows per block when reading `x_data` and `y_data`
+
+        Returns
+        -------
+        coef : np.ndarray
+            Polynomial coefficients
+        error : float
+            mean squared error
+        '''
+        if chunks is None:
+            chunks = iter_chunks(self.x_data, self.y_data, chunk_size)
+
+        accumulator = QRAccumulator()
+
+        for x, y in chunks:
+            accumulator.update(vandermonde(x, degree), y)
+
+        return accumulator.solve(degree + 1)
+
+    def partial_fit(self, x, y, degree: int, forgetting = 1.0):
+        '''
+        Online fit: update the coefficients with new observations in O(degree^2)
+        per sample (recursive least squares), without refitting the past data.
+
+        Parameters
+        ----------
+        x : float or array_like
+            New values of the independent variable
+        y : float or array_like
+            New values of the dependent variable, (b,) or (b, m) for m series
+        degree : int
+            Polynomial degree, fixed by the first call
+        forgetting : float (optional)
+            Forgetting factor in (0, 1] to track drifting data, fixed by the first call
+
+        Returns
+        -------
+        coef : np.ndarray
+            Current polynomial coefficients
+        error : float
+            Current (exponentially weighted) mean squared error
+        '''
+        if self._recursive is None:
+            self._recursive = RecursiveLeastSquares(degree + 1, forgetting)
+
+        elif self._recursive.k != degree + 1:
+            raise ValueError("Degree of a partial fit can not change, create a new PLS")
+
+        if np.ndim(x) == 0:
+            # A single sample: one response, or one response per series
+            x, y = np.atleast_1d(x), np.asarray(y)[np.newaxis]
+
+        self._recursive.update(vandermonde(x, degree), y)
+
+        return self._recursive.coef, self._recursive.mse
+
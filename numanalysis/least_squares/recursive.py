@@ -0,0 +1,173 @@
+import numpy as np
+from least_squares.solver import _scaled_gram
+
+# Largest condition number of the scaled Gram matrix of the buffered samples that
+# starts the recursion; errors in the initial P are never corrected afterwards.
+MAX_START_COND = 1e8
+
+# Largest number of buffered samples, in multiples of k. If X^T W X is still ill
+# conditioned (e.g. a column that is all zeros so far), the recursion starts from
+# the ridge solution of the buffered samples instead.
+MAX_START_SAMPLES = 4
+
+
+class RecursiveLeastSquares:
+
+    r'''
+    Recursive (online) least squares with exponential forgetting.
+
+    Minimizes \sum_i \lambda^{n - i} (y_i - x_i^T b)^2 one sample at a time.
+    The inverse weighted Gram matrix P = (X^T W X)^{-1} is kept, and a new sample
+    updates b and P with a rank one correction in O(k^2):
+
+    g = P x / (\lambda + x^T P x)
+    b = b + g (y - x^T b)
+    P = (P - g x^T P) / \lambda
+
+    The first samples are buffered until X^T W X is well conditioned, and b and P are
+    then initialized exactly, so with \lambda = 1 the coefficients match the batch
+    least squares solution. At most MAX_START_SAMPLES * k samples are buffered; past
+    that, b and P start from the ridge solution with P = (X^T W X + \delta I)^{-1},
+    \delta = max_j (X^T W X)_{jj} / MAX_START_COND. The ridge term biases the
+    coefficients slightly toward 0; its weight is not refreshed by new samples, so the
+    bias decays as O(\delta / n) for \lambda = 1 and geometrically for \lambda < 1. P only depends on X, so m responses observed together
+    share it, and b is a (k, m) matrix.
+
+    Parameters
+    ----------
+    k : int
+        Number of coefficients
+    forgetting : float (optional)
+        Forgetting factor 0 < \lambda <= 1. Observations m samples old are weighted
+        by \lambda^m; 1 weights all samples equally.
+    '''
+
+    def __init__(self, k: int, forgetting = 1.0):
+
+        if not 0 < forgetting <= 1:
+            raise ValueError("Forgetting factor must be in (0, 1]")
+
+        self.k = k
+        self.forgetting = forgetting
+        self.P = None
+        self._coef = None
+
+        # Weighted sum of squared residuals and of weights (effective sample size)
+        self._sse = 0.0
+        self._weight = 0.0
+        self.n = 0
+
+        self._X = np.empty((0, k))
+        self._Y = None
+        self._vector = True
+
+    @property
+    def coef(self) -> np.ndarray:
+        '''
+        Current coefficients. Before initialization, the minimum norm solution of the buffered samples.
+        '''
+        if self._coef is None:
+            sqrt_weights = self._sqrt_weights()[:, np.newaxis]
+            coef = np.linalg.lstsq(self._X * sqrt_weights, self._Y * sqrt_weights, rcond = None)[0]
+
+        else:
+            coef = self._coef.copy()
+
+        return coef[:, 0] if self._vector else coef
+
+    @property
+    def mse(self) -> float:
+        r'''
+        Current weighted mean squared error \sum_i \lambda^{n - i} e_i^2 / \sum_i \lambda^{n - i},
+        of every response.
+        '''
+        if not self.n:
+            return 0.0
+
+        if self._coef is None:
+            weights = self._sqrt_weights() ** 2
+            coef = self.coef.reshape(self.k, -1)
+            mse = weights @ np.square(self._Y - self._X @ coef) / weights.sum()
+
+        else:
+            mse = self._sse / self._weight
+
+        return float(mse[0]) if self._vector else mse
+
+    def _sqrt_weights(self):
+        return np.sqrt(self.forgetting ** np.arange(len(self._X) - 1, -1, -1))
+
+    def update(self, X, y):
+        '''
+        Add samples in order.
+
+        Parameters
+        ----------
+        X : array_like
+            (b, k) rows of the design matrix, or a single (k,) row
+        y : array_like
+            (b,) responses or (b, m) responses of m series. For a single row,
+            a single response or (m,) responses.
+        '''
+        X = np.asarray(X, dtype = float)
+        y = np.asarray(y, dtype = float)
+
+        if X.ndim == 1:
+            X, y = X[np.newaxis], y[np.newaxis]
+
+        if self._Y is None:
+            self._vector = y.ndim == 1
+            self._Y = np.empty((0, 1 if self._vector else y.shape[1]))
+
+        Y = y.reshape(len(X), -1)
+
+        for x_i, y_i in zip(X, Y):
+
+            if self._coef is None:
+                self._buffer(x_i, y_i)
+                continue
+
+            lam = self.forgetting
+            Px = self.P @ x_i
+            denom = lam + x_i @ Px
+            gain = Px / denom
+            error = y_i - x_i @ self._coef
+
+            self._coef += np.outer(gain, error)
+            self.P = (self.P - np.outer(gain, Px)) / lam
+            self.P = (self.P + self.P.T) / 2
+
+            # Minimal cost J_n = lam J_{n-1} + lam e^2 / (lam + x^T P x)
+            self._sse = lam * self._sse + lam * error ** 2 / denom
+            self._weight = lam * self._weight + 1
+            self.n += 1
+
+    def _buffer(self, x, y):
+
+        self._X = np.vstack([self._X, x])
+        self._Y = np.vstack([self._Y, y])
+        self.n += 1
+
+        if len(self._X) < self.k:
+            return
+
+        sqrt_weights = self._sqrt_weights()
+        X = self._X * sqrt_weights[:, np.newaxis]
+        gram = X.T @ X
+
+        if np.linalg.cond(_scaled_gram(X)[0]) <= MAX_START_COND:
+            # Exact start from the buffered samples
+            self.P = np.linalg.inv(gram)
+
+        elif len(self._X) >= MAX_START_SAMPLES * self.k:
+            # Regularized start, so the buffer and the cost per sample stay bounded
+            delta = np.max(np.diag(gram)) / MAX_START_COND or 1.0
+            self.P = np.linalg.inv(gram + delta * np.eye(self.k))
+
+        else:
+            return
+
+        self._coef = self.P @ (X.T @ (self._Y * sqrt_weights[:, np.newaxis]))
+        self._sse = np.sum(np.square((self._Y - self._X @ self._coef) * sqrt_weights[:, np.newaxis]), axis = 0)
+        self._weight = float(np.sum(sqrt_weights ** 2))
+        self._X, self._Y = self._X[:0], self._Y[:0]
@@ -0,0 +1,193 @@
+import numpy as np
+
+# Rows per block of the blocked QR factorization
+QR_BLOCK_ROWS = 2**16
+
+# Largest condition number of the column-scaled Gram matrix solved by Cholesky,
+# which loses about log10(cond) digits; QR on X loses only half as many.
+CHOLESKY_MAX_COND = 1e6
+
+
+def vandermonde(x, degree: int) -> np.ndarray:
+    '''
+    Vandermonde matrix [1, x, x ** 2, ..., x ** degree] in a single allocation,
+    each column computed from the previous one with one multiplication.
+
+    Parameters
+    ----------
+    x : array_like[float]
+        Values of the independent variable
+    degree : int
+        Polynomial degree
+
+    Returns
+    -------
+    X : np.ndarray
+        (n, degree + 1) design matrix
+    '''
+    x = np.asarray(x, dtype = float)
+    X = np.empty((len(x), degree + 1))
+    X[:, 0] = 1
+
+    for i in range(1, degree + 1):
+        np.multiply(X[:, i - 1], x, out = X[:, i])
+
+    return X
+
+
+def _scaled_gram(X):
+    '''
+    Gram matrix X^T X with unit diagonal, D X^T X D with D = diag(1 / |X_j|).
+    '''
+    gram = X.T @ X
+    scale = np.sqrt(np.diag(gram))
+    scale[scale == 0] = 1
+
+    return gram / np.outer(scale, scale), scale
+
+
+def lstsq(X, y, method = "auto"):
+    '''
+    Least squares solution of min |X b - y|.
+
+    Parameters
+    ----------
+    X : array_like
+        (n, k) design matrix
+    y : array_like
+        (n,) response, or (n, m) responses solved at once
+    method : str (optional)
+        "cholesky" - Cholesky factorization of the column-scaled Gram matrix X^T X.
+                     Fastest for tall X, but squares the condition number.
+        "qr"       - QR factorization of [X, y], by blocks of rows: the R factors of the
+                     blocks are stacked and factorized again. Q is never formed.
+        "svd"      - SVD of X; minimum norm solution for rank deficient X.
+        "auto"     - Cholesky if the scaled Gram matrix is well conditioned,
+                     QR if it is not, and SVD if X is numerically rank deficient.
+
+    Returns
+    -------
+    b : np.ndarray
+        (k,) or (k, m) coefficients
+    '''
+    X = np.asarray(X, dtype = float)
+    y = np.asarray(y, dtype = float)
+
+    if method == "auto":
+        gram, scale = _scaled_gram(X)
+        cond = np.linalg.cond(gram)
+
+        if cond < CHOLESKY_MAX_COND:
+            return _cholesky(X, y, gram, scale)
+
+        method = "qr" if cond < 1 / np.finfo(float).eps else "svd"
+
+    if method == "cholesky":
+        gram, scale = _scaled_gram(X)
+        return _cholesky(X, y, gram, scale)
+
+    elif method == "qr":
+        k = X.shape[1]
+        R = _qr_r(X, y)
+        b = np.linalg.solve(R[:k, :k], R[:k, k:])
+
+        return b[:, 0] if y.ndim == 1 else b
+
+    elif method == "svd":
+        return np.linalg.lstsq(X, y, rcond = None)[0]
+
+    else:
+        raise ValueError("Invalid method. Choose from: ['auto', 'cholesky', 'qr', 'svd']")
+
+
+def _qr_r(X, y):
+    '''
+    R factor of the augmented matrix [X, y]. The top right block of R is Q^T y.
+    '''
+    accumulator = QRAccumulator()
+
+    for start in range(0, len(X), QR_BLOCK_ROWS):
+        stop = start + QR_BLOCK_ROWS
+        accumulator.update(X[start:stop], y[start:stop])
+
+    return accumulator.R
+
+
+def _cholesky(X, y, gram, scale):
+
+    L = np.linalg.cholesky(gram)
+    rhs = (X.T @ y) / (scale if y.ndim == 1 else scale[:, np.newaxis])
+    b = np.linalg.solve(L.T, np.linalg.solve(L, rhs))
+
+    return b / (scale if y.ndim == 1 else scale[:, np.newaxis])
+
+
+def iter_chunks(x_data, y_data, chunk_size = QR_BLOCK_ROWS):
+    '''
+    Consecutive (x, y) blocks of rows, e.g. of `np.memmap` arrays, read one at a time.
+    '''
+    for start in range(0, len(x_data), chunk_size):
+        stop = start + chunk_size
+        yield np.asarray(x_data[start:stop], dtype = float), np.asarray(y_data[start:stop], dtype = float)
+
+
+class QRAccumulator:
+
+    '''
+    Incremental QR factorization of [X, y] over blocks of rows.
+
+    Only the (k + 1) x (k + 1) R factor is kept: after each block, the previous R
+    is stacked on the block and factorized again. Memory is O(k^2) regardless of
+    the number of rows, and since X^T X is never formed, the result matches the
+    in-memory QR solution.
+
+    Attributes
+    ----------
+    R : np.ndarray
+        R factor of [X, y]
+    n : int
+        Number of rows accumulated so far
+    '''
+
+    def __init__(self):
+        self.R = None
+        self.n = 0
+
+    def update(self, X, y):
+        '''
+        Add a block of rows: (n_i, k) design and (n_i,) or (n_i, m) responses.
+        '''
+        block = np.column_stack([X, y])
+
+        if self.R is not None:
+            block = np.vstack([self.R, block])
+
+        self.R = np.linalg.qr(block, mode = "r")
+        self.n += len(X)
+        self._vector = np.ndim(y) == 1
+
+    def solve(self, k: int):
+        '''
+        Parameters
+        ----------
+        k : int
+            Number of columns of X
+
+        Returns
+        -------
+        b : np.ndarray
+            (k,) or (k, m) coefficients
+        mse : float or np.ndarray
+            Mean squared error of every response, from the bottom right block of R
+        '''
+        if self.R is None:
+            raise ValueError("No data accumulated")
+
+        R = self.R
+        b = np.linalg.lstsq(R[:k, :k], R[:k, k:], rcond = None)[0]
+        mse = np.sum(np.square(R[k:, k:]), axis = 0) / self.n
+
+        if self._vector:
+            return b[:, 0], float(mse[0])
+
+        return b, mse
@@ -0,0 +1,329 @@
+import numpy as np
+
+
+class CSRMatrix:
+
+    '''
+    Compressed sparse row matrix: the nonzeros of row i are data[indptr[i]:indptr[i + 1]],
+    in the columns indices[indptr[i]:indptr[i + 1]] (the layout of `scipy.sparse.csr_matrix`).
+    Products with vectors cost O(nnz) and memory scales with the number of nonzeros.
+
+    Parameters
+    ----------
+    data : array_like[float]
+        Nonzero values
+    indices : array_like[int]
+        Column of every nonzero value
+    indptr : array_like[int]
+        Start of every row in data, of length n + 1
+    shape : tuple
+        (n, k)
+    '''
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype = float)
+        self.indices = np.asarray(indices, dtype = np.intp)
+        self.indptr = np.asarray(indptr, dtype = np.intp)
+        self.shape = tuple(shape)
+
+        # Row of every nonzero value, so products are a single bincount
+        self._rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype = float)
+        rows, columns = np.nonzero(A)
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength = A.shape[0]))])
+
+        return cls(A[rows, columns], columns, indptr, A.shape)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def toarray(self) -> np.ndarray:
+        A = np.zeros(self.shape)
+        np.add.at(A, (self._rows, self.indices), self.data)
+        return A
+
+    def __matmul__(self, v):
+        '''
+        A @ v for a (k,) vector.
+        '''
+        return np.bincount(self._rows, weights = self.data * v[self.indices], minlength = self.shape[0])
+
+    def rmatvec(self, u):
+        '''
+        A^T @ u for a (n,) vector.
+        '''
+        return np.bincount(self.indices, weights = self.data * u[self._rows], minlength = self.shape[1])
+
+    def column_sums(self, power = 1):
+        '''
+        Sums of every column of A ** power (elementwise).
+        '''
+        return np.bincount(self.indices, weights = self.data ** power, minlength = self.shape[1])
+
+
+def is_sparse(X) -> bool:
+    '''
+    CSR-style matrix: `CSRMatrix` or any object with the same layout (e.g. `scipy.sparse.csr_matrix`).
+    '''
+    return all(hasattr(X, name) for name in ("data", "indices", "indptr", "shape"))
+
+
+def as_csr(X) -> CSRMatrix:
+    '''
+    `CSRMatrix` sharing the layout of a CSR-style matrix.
+    '''
+    return X if isinstance(X, CSRMatrix) else CSRMatrix(X.data, X.indices, X.indptr, X.shape)
+
+
+class _Operator:
+
+    r'''
+    Matrix-free least squares operator for min |X b + b_0 - y|^2 + damping^2 |b|^2.
+
+    The intercept b_0 is eliminated by centering: X_c = X - 1 \mu^T is applied as
+    X v - (\mu^T v) 1, which keeps X sparse. With Jacobi preconditioning the unknowns
+    are z = D^{-1} b, D = diag(1 / |X_c e_j|), and ridge damping is applied exactly on
+    b through the extra rows damping D z.
+    '''
+
+    def __init__(self, X, damping = 0.0, precondition = True):
+
+        self.X = X
+        n, k = X.shape
+
+        if is_sparse(X):
+            X = as_csr(X)
+            self._matvec, self._rmatvec = X.__matmul__, X.rmatvec
+            sums, squares = X.column_sums(), X.column_sums(2)
+
+        else:
+            X = np.asarray(X, dtype = float)
+            self._matvec, self._rmatvec = X.__matmul__, X.T.__matmul__
+            sums, squares = X.sum(axis = 0), np.square(X).sum(axis = 0)
+
+        self.n = n
+        self.mean = sums / n
+        self.damping = damping
+
+        if precondition:
+            # |X_c e_j|^2 = sum_i X_ij^2 - n mu_j^2
+            norms = np.sqrt(np.maximum(squares - n * self.mean ** 2, 0))
+            norms[norms == 0] = 1
+            self.scale = 1 / norms
+
+        else:
+            self.scale = np.ones(k)
+
+    def matvec(self, z):
+        v = self.scale * z
+        Xv = self._matvec(v) - self.mean @ v
+
+        return np.concatenate([Xv, self.damping * v]) if self.damping else Xv
+
+    def rmatvec(self, u):
+        r, t = u[:self.n], u[self.n:]
+        XTu = self._rmatvec(r) - self.mean * r.sum()
+
+        if self.damping:
+            XTu = XTu + self.damping * t
+
+        return self.scale * XTu
+
+    def rhs(self, y):
+        y = y - y.mean()
+        return np.concatenate([y, np.zeros(len(self.scale))]) if self.damping else y
+
+
+def lsqr(matvec, rmatvec, b, k, tolerance = 1e-10, max_iter = None):
+    r'''
+    LSQR: min |A x - b| by Golub-Kahan bidiagonalization. Mathematically equivalent to
+    conjugate gradients on A^T A x = A^T b, but more stable.
+
+    Parameters
+    ----------
+    matvec, rmatvec : callable
+        x -> A x and u -> A^T u
+    b : np.ndarray
+        Right hand side
+    k : int
+        Number of unknowns
+    tolerance : float (optional)
+        Stop when |A^T r| <= tolerance |A| |r| or |r| <= tolerance |b|
+    max_iter : int (optional)
+        Maximum number of iterations, 2 k by default
+
+    Returns
+    -------
+    x : np.ndarray
+        Solution
+    iterations : int
+        Number of iterations
+
+    Reference:
+    Paige, C. C., & Saunders, M. A. (1982). LSQR: An Algorithm for Sparse Linear Equations
+    and Sparse Least Squares. ACM Transactions on Mathematical Software, 8(1), 43-71.
+    '''
+    max_iter = 2 * k if max_iter is None else max_iter
+    x = np.zeros(k)
+
+    u = b.copy()
+    beta = b_norm = np.linalg.norm(u)
+
+    if beta == 0:
+        return x, 0
+
+    u /= beta
+    v = rmatvec(u)
+    alpha = np.linalg.norm(v)
+
+    if alpha == 0:
+        return x, 0
+
+    v /= alpha
+    w = v.copy()
+    phibar, rhobar = beta, alpha
+    a_norm2 = 0.0
+    iter = 0
+
+    while iter < max_iter:
+        iter += 1
+
+        u = matvec(v) - alpha * u
+        beta = np.linalg.norm(u)
+
+        if beta > 0:
+            u /= beta
+
+        a_norm2 += alpha ** 2 + beta ** 2
+
+        v = rmatvec(u) - beta * v
+        alpha = np.linalg.norm(v)
+
+        if alpha > 0:
+            v /= alpha
+
+        # Plane rotation eliminating the subdiagonal beta
+        rho = np.hypot(rhobar, beta)
+        c, s = rhobar / rho, beta / rho
+        theta = s * alpha
+        rhobar = - c * alpha
+        phi = c * phibar
+        phibar = s * phibar
+
+        x += (phi / rho) * w
+        w = v - (theta / rho) * w
+
+        # |r| = phibar and |A^T r| = phibar alpha |c|
+        r_norm = abs(phibar)
+        ar_norm = abs(phibar * alpha * c)
+
+        if r_norm <= tolerance * b_norm or ar_norm <= tolerance * np.sqrt(a_norm2) * r_norm:
+            break
+
+    return x, iter
+
+
+def cgls(matvec, rmatvec, b, k, tolerance = 1e-10, max_iter = None):
+    r'''
+    CGLS: conjugate gradients on the normal equations A^T A x = A^T b, without forming A^T A.
+
+    Parameters
+    ----------
+    matvec, rmatvec : callable
+        x -> A x and u -> A^T u
+    b : np.ndarray
+        Right hand side
+    k : int
+        Number of unknowns
+    tolerance : float (optional)
+        Stop when |A^T r| <= tolerance |A^T b|
+    max_iter : int (optional)
+        Maximum number of iterations, 2 k by default
+
+    Returns
+    -------
+    x : np.ndarray
+        Solution
+    iterations : int
+        Number of iterations
+    '''
+    max_iter = 2 * k if max_iter is None else max_iter
+    x = np.zeros(k)
+    r = b.copy()
+    s = rmatvec(r)
+    p = s.copy()
+    gamma = s0 = s @ s
+    iter = 0
+
+    while iter < max_iter and gamma > tolerance ** 2 * s0:
+        iter += 1
+
+        q = matvec(p)
+        step = gamma / (q @ q)
+        x += step * p
+        r -= step * q
+        s = rmatvec(r)
+
+        gamma, gamma_old = s @ s, gamma
+        p = s + (gamma / gamma_old) * p
+
+    return x, iter
+
+
+def solve(X, y, method = "lsqr", damping = 0.0, precondition = True, tolerance = 1e-10, max_iter = None):
+    '''
+    Intercept and coefficients of min |X b + b_0 - y|^2 + damping^2 |b|^2 by an iterative method.
+
+    Parameters
+    ----------
+    X : np.ndarray or CSRMatrix
+        (n, k) dense or sparse design, without a column of ones
+    y : np.ndarray
+        (n,) response, or (n, m) responses solved one after the other
+    method : str (optional)
+        "lsqr" or "cgls"
+    damping : float (optional)
+        Ridge damping of the coefficients (not of the intercept)
+    precondition : bool (optional)
+        Scale the centered columns of X to unit norm (Jacobi preconditioning)
+    tolerance : float (optional)
+        Relative tolerance of the iterative method
+    max_iter : int (optional)
+        Maximum number of iterations per response
+
+    Returns
+    -------
+    intercept : float or np.ndarray
+        b_0, of every response
+    coef : np.ndarray
+        (k,) coefficients, (k, m) for m responses
+    iterations : int or np.ndarray
+        Number of iterations, of every response
+    '''
+    solvers = {"lsqr": lsqr, "cgls": cgls}
+
+    if method not in solvers:
+        raise ValueError("Invalid method. Choose from: ['lsqr', 'cgls']")
+
+    operator = _Operator(X, damping, precondition)
+    y = np.asarray(y, dtype = float)
+    Y = y[:, np.newaxis] if y.ndim == 1 else y
+    k = X.shape[1]
+
+    coef = np.empty((k, Y.shape[1]))
+    iterations = np.empty(Y.shape[1], dtype = int)
+
+    for j, y_j in enumerate(Y.T):
+        z, iterations[j] = solvers[method](operator.matvec, operator.rmatvec, operator.rhs(y_j), k, tolerance, max_iter)
+        coef[:, j] = operator.scale * z
+
+    intercept = Y.mean(axis = 0) - operator.mean @ coef
+
+    if y.ndim == 1:
+        return float(intercept[0]), coef[:, 0], int(iterations[0])
+
+    return intercept, coef, iterations
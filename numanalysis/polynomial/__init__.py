@@ -1 +1,2 @@
-from .legendre_roots_weights import Legendre
\ No newline at end of file
+from .legendre_roots_weights import Legendre
+from .legendre_cache import LegendreCache, default_cache
\ No newline at end of file
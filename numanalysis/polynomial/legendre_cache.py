@@ -0,0 +1,159 @@
+from collections import OrderedDict
+import os
+import tempfile
+import threading
+import zipfile
+
+import numpy as np
+
+from polynomial.legendre_roots_weights import Legendre
+
+
+class LegendreCache:
+
+    """
+    Two-level cache of Gauss-Legendre roots and weights, keyed by degree.
+
+    Level 1 is an in-process LRU of at most `maxsize` degrees. Level 2 is an optional
+    directory of float64 arrays, one `legendre_<degree>.npz` file per degree, tagged
+    with `VERSION` so that stale files are regenerated. Files are written atomically, so
+    several processes can share one directory.
+
+    Parameters
+    ----------
+    maxsize : int (optional)
+        Number of degrees kept in memory.
+    path : str (optional)
+        Directory of the on-disk store. No disk level if None.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups served from memory.
+    disk_hits : int
+        Lookups served from disk.
+    misses : int
+        Lookups that had to compute the roots and weights.
+    """
+
+    VERSION = 1
+
+    def __init__(self, maxsize = 128, path = None):
+
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, degree: int):
+        """
+        Roots and weights of the `degree`-point Gauss-Legendre rule.
+
+        Returns
+        -------
+        roots : np.ndarray
+            Read-only array of the roots of P_degree, in increasing order.
+        weights : np.ndarray
+            Read-only array of the corresponding quadrature weights.
+        """
+        with self._lock:
+            if degree in self._lru:
+                self._lru.move_to_end(degree)
+                self.hits += 1
+                return self._lru[degree]
+
+        roots_weights = self._load(degree)
+
+        if roots_weights is None:
+            legendre = Legendre(degree)
+            roots_weights = (legendre.roots, legendre.weights)
+            self._save(degree, roots_weights)
+
+            with self._lock:
+                self.misses += 1
+
+        else:
+            with self._lock:
+                self.disk_hits += 1
+
+        for array in roots_weights:
+            array.flags.writeable = False
+
+        with self._lock:
+            self._lru[degree] = roots_weights
+            self._lru.move_to_end(degree)
+
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last = False)
+
+        return roots_weights
+
+    def prewarm(self, degrees):
+        """
+        Compute and store the rules of all `degrees`, e.g. range(2, 201) at deploy time.
+        """
+        for degree in degrees:
+            self.get(degree)
+
+    def clear(self):
+        """
+        Empty the in-process level and reset the counters. Files on disk are kept.
+        """
+        with self._lock:
+            self._lru.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def _file(self, degree):
+        return os.path.join(self.path, f"legendre_{degree}.npz")
+
+    def _load(self, degree):
+
+        if self.path is None:
+            return None
+
+        try:
+            with np.load(self._file(degree)) as data:
+                if int(data["version"]) != self.VERSION:
+                    return None
+
+                return (np.array(data["roots"], dtype = np.float64),
+                        np.array(data["weights"], dtype = np.float64))
+
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            # Missing, truncated or corrupt files are misses and get overwritten
+            return None
+
+    def _save(self, degree, roots_weights):
+
+        if self.path is None:
+            return
+
+        tmp = None
+
+        try:
+            os.makedirs(self.path, exist_ok = True)
+
+            # Write to a temporary file first, so readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir = self.path, suffix = ".npz")
+
+            with os.fdopen(fd, "wb") as file:
+                np.savez(file, roots = roots_weights[0], weights = roots_weights[1],
+                         version = self.VERSION)
+
+            os.replace(tmp, self._file(degree))
+
+        except OSError:
+            # The cache is an optimization; a read-only or missing directory is not an error
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+
+# Shared cache consulted by quad.Gaussian. The disk level is enabled by setting
+# the NUMANALYSIS_CACHE_DIR environment variable (or `default_cache.path`).
+default_cache = LegendreCache(path = os.environ.get("NUMANALYSIS_CACHE_DIR"))
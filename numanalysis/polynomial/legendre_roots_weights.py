@@ -1,151 +1,115 @@
 import json
 
-from numpy.polynomial import Polynomial as P
 import numpy as np
-import sympy
-import math
-import os
-import sys
-sys.path.append('numanalysis')
-
-from root import Newton
-from quad import Trapezoid
 
 
 class Legendre:
-    
-    def __init__(self, degree: int):
-        
-        self.x = sympy.symbols("x")
+
+    """
+    Roots and Gauss-Legendre quadrature weights of the Legendre polynomial P_n.
+
+    All n roots are refined at once by Newton's method, with P_n and P_n' evaluated
+    by the three-term recurrence in O(n) per point, so each iteration costs O(n^2).
+    The weights then follow in closed form,
+    $w_i = 2 / ((1 - x_i^2) P_n'(x_i)^2)$.
+
+    Parameters
+    ----------
+    degree : int
+        Degree n of the Legendre polynomial, i.e. number of quadrature points.
+    tolerance : float (optional)
+        Acceptable Newton step for the roots.
+    max_iter : int (optional)
+        Maximum number of Newton iterations.
+    """
+
+    def __init__(self, degree: int, tolerance = 1e-15, max_iter = 100):
+
+        if degree < 1:
+            raise ValueError("Polynomial order should be atleast 1")
+
         self.n = degree
 
-        self._leg_polynomial = self._legendre_polynomial(degree)
-        self._leg_coefs = self._legendre_coefs()
-        self._leg_roots = self._legendre_roots()
+        self._leg_roots = self._legendre_roots(tolerance, max_iter)
         self._quad_coefs = self._quadrature_coefs()
-        
-    def _legendre_polynomial(self, n):
-        
+
+    @property
+    def roots(self):
+        return self._leg_roots
+
+    @property
+    def weights(self):
+        return self._quad_coefs
+
+    def _legendre_polynomial(self, x):
+
         """
-        N order Legendre Polynomial generation via generating function:
+        N order Legendre Polynomial and its derivative via the recurrence:
         $P_{n + 1}(x) = ((2 * n + 1) x P_n(x) - nP_{n - 1}(x))/ (n + 1)$
+        $P_n'(x) = n (x P_n(x) - P_{n - 1}(x)) / (x^2 - 1)$
 
         Parameters
         ----------
-        n : int
-            order of Legendre Polynomial.
+        x : array_like
+            Points in (-1, 1) where P_n is evaluated.
 
-        x : sympy.core.symbol.Symbol
-            Representative variable 'x'.
-        
         Result
         -------
-        coef : array_like
-            Coefficients of the Legendre Polynomial
+        p : array_like
+            P_n(x)
+        dp : array_like
+            P_n'(x)
 
 
         Reference:
         Arfken, George B.; Weber, Hans J. (2005). Mathematical Methods for Physicists. Elsevier Academic Press. ISBN 0-12-059876-0.
         """
-        x = np.array(self.x)
-        
-        if (n == 0):
-            return x * 0 + 1
-        
-        elif (n == 1):
-            return x
-        else:
-            return (((2 * (n - 1) + 1) * x * self._legendre_polynomial(n - 1) \
-                     - (n - 1) * self._legendre_polynomial(n - 2)) / (n))
-        
+        p_prev = np.ones_like(x)
+        p = x.copy()
+
+        for k in range(1, self.n):
+            p_prev, p = p, ((2 * k + 1) * x * p - k * p_prev) / (k + 1)
+
+        dp = self.n * (x * p - p_prev) / (x ** 2 - 1)
 
-    def _legendre_coefs(self):
+        return p, dp
 
-        # extract coefficients
-        coefs = np.flip(np.asarray(sympy.Poly(self._leg_polynomial).all_coeffs())) 
-        return P(coefs)
-    
-    def _legendre_roots(self, tol = 1e-5):
+    def _legendre_roots(self, tolerance, max_iter):
 
         polyorder = self.n
 
-        if polyorder < 2:
-            raise ValueError("Polynomial order should be atleast 2")
+        # Initial approximations of the roots, in decreasing order
+        i = np.arange(1, polyorder + 1)
+        roots = np.cos(np.pi * (i - 0.25) / (polyorder + 0.5))
 
-        else:
-            roots = []
-            # The polynomials are alternately even and odd functions. So we evaluate only half the number of roots. 
-
-            for i in range(1, int(polyorder / 2 + 1)):
-
-                p0 = math.cos(math.pi * (i - 0.25) / (polyorder + 0.5))
-                
-                # Root finding using Newton - Raphson Method
-                root = Newton(self._leg_coefs).fit(p0, tolerance = tol, max_iter = 10000)
-                
-                roots.append(root)
-                
-
-        # Use symmetry to get the other roots
-
-            roots = np.array(roots)
-
-            if polyorder % 2 == 0:
-                roots = np.concatenate( (1.0 * roots, - roots[::-1]) )
-
-                
-            else:
-                roots = np.concatenate((1.0 * roots, [0], - roots[::-1]))
-
-            roots.sort()
-        return roots
-
-    def _poly_to_fun(self, poly):
-            
-            """
-            Express polynomial as a function
-            Parameter
-            ----------
-            x: float
-                The value that the polynomial takes.       
-            Returns
-            --------
-            float: float
-                The value of the polynomial at x.
-
-            """
-            poly_coef = np.flip(np.asarray(sympy.Poly(poly).all_coeffs()))
-
-            def eval(val):
-                return sum([a * val ** i for i, a in enumerate(poly_coef)])
-            
-            return eval
+        iter = 0
 
-    def _quadrature_coefs(self):
+        while iter < max_iter:
 
-        quad_coef = []
+            # Newton - Raphson step on all roots at once
+            p, dp = self._legendre_polynomial(roots)
+            step = p / dp
+            roots = roots - step
 
-        for i in range(len(self._leg_roots)):
-            prod = 1
+            if np.max(np.abs(step)) < tolerance:
+                break
+
+            iter += 1
 
-            for j in range(len(self._leg_roots)):
+            if iter == max_iter:
+                raise NotImplementedError(f"Method failed, max iterations of ({max_iter}) reached!")
 
-                if j != i:
-                    p = (self.x - float(self._leg_roots[j])) / (float(self._leg_roots[i]) - float(self._leg_roots[j]))
+        # The polynomials are alternately even and odd functions, so the roots are symmetric
+        roots = (roots - roots[::-1]) / 2
 
-                    prod *= p
+        return np.sort(roots)
 
-                else:
-                    continue
-            
-            prod_poly_fun = self._poly_to_fun(prod)
+    def _quadrature_coefs(self):
 
-            c_i = Trapezoid(prod_poly_fun, [-1, 1], partition = 100).fit()
+        _, dp = self._legendre_polynomial(self._leg_roots)
+
+        return 2 / ((1 - self._leg_roots ** 2) * dp ** 2)
 
-            quad_coef.append(c_i)
-        
-        return quad_coef
-    
     def roots_weights(self, save_file = True):
 
         roots_weights_dict = {}
@@ -157,5 +121,5 @@ class Legendre:
             with open("legendre_roots_weights.json", "w") as lrw:
                 json.dump(roots_weights_dict, lrw, indent = 1)
                 return None
-        else:      
-            return roots_weights_dict
\ No newline at end of file
+        else:
+            return roots_weights_dict
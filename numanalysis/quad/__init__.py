@@ -1,3 +1,4 @@
 from .simpson import Simpson
 from .trapezoid import Trapezoid
-from .gaussian import Gaussian
\ No newline at end of file
+from .gaussian import Gaussian
+from .adaptive import Adaptive
\ No newline at end of file
@@ -0,0 +1,166 @@
+
+import numpy as np
+from polynomial import default_cache
+
+class Adaptive:
+    r"""
+    Adaptive Quadrature Method:
+    Approximate \int_a ^b f(x) \dx to within a tolerance.
+
+    The interval is subdivided only where the local error estimate is too large,
+    so smooth regions use few function evaluations.
+
+    "simpson" : Simpson's rule on [a, b] (partition = 2) is compared with Simpson's rule
+                on both halves; their difference / 15 estimates the error. The endpoint and
+                midpoint values are reused, so each subdivision costs 2 new evaluations.
+    "gauss"   : The Gauss-Legendre rule of the given degree on [a, b] is compared with
+                the rule on both halves. The halves become the whole-interval estimates
+                of the next level, so each subdivision costs 2 * degree new evaluations.
+
+    Parameters
+    ----------
+
+    fun : callable
+        Function f(x) to be integrated
+    bounds : array_like
+        Upper and lower bound of the form [a, b]
+    tolerance : float (optional)
+        Acceptable absolute error
+    method : str (optional)
+        "simpson" or "gauss"
+    degree : int (optional)
+        Degree of the Gauss-Legendre rule for method = "gauss"
+    max_depth : int (optional)
+        Maximum number of subdivisions of any subinterval. Subintervals at this depth
+        are accepted and their error counts towards the reported error estimate.
+    vectorized : bool (optional)
+        Evaluate f on an array of the nodes of each subinterval instead of once per node
+
+    Returns
+    -------
+    integral : float
+        Approximation of the integral
+    """
+
+    def __init__(self, fun: callable, bounds: np.ndarray, tolerance = 1e-8, method = "simpson",
+                 degree = 5, max_depth = 50, vectorized = False):
+
+        self.fun = fun
+        self.a = bounds[0]
+        self.b = bounds[1]
+        self.tolerance = tolerance
+        self.method = method
+        self.max_depth = max_depth
+        self.vectorized = vectorized
+        self.n_eval = 0
+
+        if method == "gauss":
+            self._roots, self._weights = default_cache.get(degree)
+
+        elif method != "simpson":
+            raise ValueError("Invalid method. Choose from: ['simpson', 'gauss']")
+
+    def _eval(self, nodes):
+        """
+        Evaluate f at the nodes and count the evaluations.
+        """
+        nodes = np.asarray(nodes, dtype = float)
+        self.n_eval += nodes.size
+
+        if self.vectorized:
+            return np.broadcast_to(self.fun(nodes), nodes.shape)
+
+        return np.array([self.fun(node) for node in nodes])
+
+    def _gauss(self, a, b):
+
+        # rescale [-1, 1] into [a, b]
+        nodes = (b - a) / 2 * self._roots + (a + b) / 2
+        return (b - a) / 2 * (self._weights @ self._eval(nodes))
+
+    def fit(self, full_output = False):
+        """
+        Parameters
+        ----------
+        full_output : bool (optional)
+            Also return the error estimate and the number of function evaluations
+
+        Returns
+        -------
+        integral : float
+            Approximation of the integral
+        error : float
+            Estimate of the absolute error, only if `full_output`
+        n_eval : int
+            Number of function evaluations, only if `full_output`
+        """
+        self.n_eval = 0
+
+        if self.method == "simpson":
+            integral, error = self._fit_simpson()
+
+        else:
+            integral, error = self._fit_gauss()
+
+        if full_output:
+            return integral, error, self.n_eval
+
+        return integral
+
+    def _fit_simpson(self):
+
+        a, b = self.a, self.b
+        f_a, f_m, f_b = self._eval([a, (a + b) / 2, b])
+        whole = (b - a) / 6 * (f_a + 4 * f_m + f_b)
+
+        stack = [(a, b, f_a, f_m, f_b, whole, self.tolerance, 0)]
+        integral = 0
+        error = 0
+
+        while stack:
+
+            a, b, f_a, f_m, f_b, whole, tol, depth = stack.pop()
+            m = (a + b) / 2
+            f_lm, f_rm = self._eval([(a + m) / 2, (m + b) / 2])
+
+            left = (m - a) / 6 * (f_a + 4 * f_lm + f_m)
+            right = (b - m) / 6 * (f_m + 4 * f_rm + f_b)
+            delta = left + right - whole
+
+            if abs(delta) <= 15 * tol or depth >= self.max_depth:
+                # Richardson extrapolation of the two Simpson estimates
+                integral += left + right + delta / 15
+                error += abs(delta) / 15
+
+            else:
+                stack.append((m, b, f_m, f_rm, f_b, right, tol / 2, depth + 1))
+                stack.append((a, m, f_a, f_lm, f_m, left, tol / 2, depth + 1))
+
+        return float(integral), float(error)
+
+    def _fit_gauss(self):
+
+        whole = self._gauss(self.a, self.b)
+
+        stack = [(self.a, self.b, whole, self.tolerance, 0)]
+        integral = 0
+        error = 0
+
+        while stack:
+
+            a, b, whole, tol, depth = stack.pop()
+            m = (a + b) / 2
+
+            left = self._gauss(a, m)
+            right = self._gauss(m, b)
+            delta = left + right - whole
+
+            if abs(delta) <= tol or depth >= self.max_depth:
+                integral += left + right
+                error += abs(delta)
+
+            else:
+                stack.append((m, b, right, tol / 2, depth + 1))
+                stack.append((a, m, left, tol / 2, depth + 1))
+
+        return float(integral), float(error)
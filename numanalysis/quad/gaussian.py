@@ -1,7 +1,6 @@
 
 import numpy as np
-import json
-from polynomial import Legendre
+from polynomial import default_cache
 
 class Gaussian:
     """
@@ -11,8 +10,9 @@ class Gaussian:
     
     This method yields greater accuracy than the trapezoid or simpson method as the
     points for evaluation are chosen optimally, rather than equally spaced. 
-    For a faster implementation, the legendre polynomial roots and weights can be
-    stored in a .json file, and imported directly here using Legendre.roots_weights(degree, save_file = True).
+    The legendre polynomial roots and weights are looked up in a LegendreCache
+    (in-process LRU, plus an on-disk store if configured), so they are computed
+    once per degree.
 
     Parameters
     ----------
@@ -20,44 +20,63 @@ class Gaussian:
     fun : callable
         Function f(x) to be integrated
     bounds : array_like
-        Upper and lower bound of the form [a, b]
+        Upper and lower bound of the form [a, b]. a and b may be arrays of the same
+        shape, to integrate over many intervals [a_i, b_i] at once.
     degree: int
         Degree of the polynomial to choose the points [x0, x1, .., x_k]
+    cache: LegendreCache (optional)
+        Cache of roots and weights, `polynomial.default_cache` by default
+    vectorized: bool (optional)
+        Evaluate f once on the array of all nodes of all intervals, of shape
+        bounds[0].shape + (degree,). f may return extra trailing axes for
+        vector-valued integrands.
 
     Returns
     -------
-    integral : float
-        Approximation of the integral
+    integral : float or np.ndarray
+        Approximation of the integral, of shape bounds[0].shape + trailing axes of f
     """
     
 
-    def __init__(self, fun, bounds, degree):
+    def __init__(self, fun, bounds, degree, cache = None, vectorized = False):
 
         self.a = bounds[0]
         self.b = bounds[1]
         self.fun = fun
         self.n = degree
-        self._leg_roots_weights = self._get_legendre_roots_weights()
+        self.vectorized = vectorized
+        self._cache = cache if cache is not None else default_cache
+        self._roots, self._weights = self._get_legendre_roots_weights()
     
     def _get_legendre_roots_weights(self):
 
-        leg_roots_weights = Legendre(self. n).roots_weights(save_file = False)
-
-        return leg_roots_weights
+        return self._cache.get(self.n)
     
     def fit(self):
 
-        quad_sum = 0
-        
-        for root, weight in self._leg_roots_weights.items():
+        a = np.asarray(self.a, dtype = float)
+        b = np.asarray(self.b, dtype = float)
+
+        # rescale [-1, 1] into [a, b] for every interval at once
+        half = (b - a) / 2
+        nodes = half[..., np.newaxis] * self._roots + ((a + b) / 2)[..., np.newaxis]
+
+        if self.vectorized:
+            evaluated_fun = np.asarray(self.fun(nodes), dtype = float)
+
+            if evaluated_fun.ndim < nodes.ndim:
+                evaluated_fun = np.broadcast_to(evaluated_fun, nodes.shape)
+
+        else:
+            evaluated_fun = np.array([self.fun(node) for node in nodes.ravel()], dtype = float)
+            evaluated_fun = evaluated_fun.reshape(nodes.shape + evaluated_fun.shape[1:])
 
-            root = float(root)
-            c_i = float(weight)
-            
+        # Weighted sum over the node axis; trailing axes of f are kept
+        trailing = evaluated_fun.ndim - nodes.ndim
+        quad_sum = np.moveaxis(evaluated_fun, nodes.ndim - 1, -1) @ self._weights
+        quad_sum = quad_sum * half.reshape(half.shape + (1,) * trailing)
 
-            # rescale [a, b] into [-1, 1]
-            evaulated_fun = float(self.fun(((self.b - self.a) * root + self.a + self.b) / 2) * ((self.b - self.a)) / 2 )
+        if quad_sum.ndim == 0:
+            return float(quad_sum)
 
-            quad_sum += c_i * evaulated_fun
-        
-        return float(quad_sum)
\ No newline at end of file
+        return quad_sum
@@ -1,6 +1,7 @@
 
 
 import numpy as np
+from quad.trapezoid import _grid_sum
 
 class Simpson:
     """
@@ -16,6 +17,10 @@ class Simpson:
         Upper and lower bound of the form [a, b]
     partition: int
         Number of subintervals fo composite quadrature
+    vectorized: bool (optional)
+        Evaluate f once on an array of nodes instead of once per node
+    chunk_size: int (optional)
+        With `vectorized`, evaluate f on at most `chunk_size` nodes at a time
 
     Returns
     -------
@@ -23,12 +28,14 @@ class Simpson:
         Approximation of the integral
     """
 
-    def __init__(self, fun: callable, bounds: np.ndarray, partition: int):
+    def __init__(self, fun: callable, bounds: np.ndarray, partition: int, vectorized = False, chunk_size = None):
 
         self.n = partition
         self.fun = fun
         self.a = bounds[0]
         self.b = bounds[1]
+        self.vectorized = vectorized
+        self.chunk_size = chunk_size
 
         self.h = (self.b - self.a) / self.n
 
@@ -36,21 +43,27 @@ class Simpson:
     def fit(self):
 
         sum_0 = self.fun(self.a) + self.fun(self.b)
-        sum_1 = 0
-        sum_2 = 0
-        iter = 1
 
-        while iter < self.n:
+        if self.vectorized:
+            sum_1 = _grid_sum(self.fun, self.a, self.h, 1, self.n, 2, self.chunk_size)
+            sum_2 = _grid_sum(self.fun, self.a, self.h, 2, self.n, 2, self.chunk_size)
 
-            val = self.a + (iter * self.h)
-            
-            if iter % 2 == 0:
-                sum_2 += self.fun(val)
-            
-            else:
-                sum_1 += self.fun(val)
+        else:
+            sum_1 = 0
+            sum_2 = 0
+            iter = 1
 
-            iter += 1
+            while iter < self.n:
+
+                val = self.a + (iter * self.h)
+                
+                if iter % 2 == 0:
+                    sum_2 += self.fun(val)
+                
+                else:
+                    sum_1 += self.fun(val)
+
+                iter += 1
 
         integral = (self.h / 3) * (sum_0 + 2 * sum_2 + 4 * sum_1) 
 
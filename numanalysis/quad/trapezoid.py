@@ -15,6 +15,10 @@ class Trapezoid:
         Upper and lower bound of the form [a, b]
     partition: int
         Number of subintervals fo composite quadrature
+    vectorized: bool (optional)
+        Evaluate f once on an array of nodes instead of once per node
+    chunk_size: int (optional)
+        With `vectorized`, evaluate f on at most `chunk_size` nodes at a time
 
     Returns
     -------
@@ -22,37 +26,122 @@ class Trapezoid:
         Approximation of the integral
     """
 
-    def __init__(self, fun: callable, bounds: np.ndarray, partition: int):
+    def __init__(self, fun: callable, bounds: np.ndarray, partition: int, vectorized = False, chunk_size = None):
 
         self.fun = fun
         self.n = partition      
         self.a = bounds[0]
         self.b = bounds[1]
+        self.vectorized = vectorized
+        self.chunk_size = chunk_size
 
         self.h = (self.b - self.a) / self.n
 
     def fit(self):
 
         sum_0 = self.fun(self.a) + self.fun(self.b)
-        sum_1 = 0
-        iter = 1
 
-        while iter < self.n:
+        if self.vectorized:
+            sum_1 = _grid_sum(self.fun, self.a, self.h, 1, self.n, 1, self.chunk_size)
 
-            val = self.a + (iter * self.h)
-            sum_1 += self.fun(val)
+        else:
+            sum_1 = 0
+            iter = 1
 
-            iter += 1
+            while iter < self.n:
+
+                val = self.a + (iter * self.h)
+                sum_1 += self.fun(val)
+
+                iter += 1
 
         integral = (self.h / 2) * (sum_0 + 2 * sum_1) 
 
         return integral
-    
 
+    def romberg(self, tolerance = 1e-10, max_level = 20, full_output = False):
+        """
+        Romberg Integration:
+        Halve the step of the composite trapezoid rule, starting from `partition`
+        subintervals, and apply Richardson extrapolation until two successive diagonal
+        entries of the Romberg table agree to within `tolerance`. Each level only
+        evaluates f at the new midpoints.
+
+        Parameters
+        ----------
+        tolerance : float (optional)
+            Acceptable error level
+        max_level : int (optional)
+            Maximum number of step halvings
+        full_output : bool (optional)
+            Also return the error estimate and the number of function evaluations
+
+        Returns
+        -------
+        integral : float
+            Approximation of the integral
+        error : float
+            Difference of the last two diagonal entries, only if `full_output`
+        n_eval : int
+            Number of function evaluations, only if `full_output`
+        """
+
+        h = self.h
+        n = self.n
+        previous = [self.fit()]
+        n_eval = n + 1
+        level = 1
+
+        while level <= max_level:
+
+            # New midpoints a + (2i + 1) * h / 2, for i = 0,..., n - 1
+            h = h / 2
+
+            if self.vectorized:
+                midpoint_sum = _grid_sum(self.fun, self.a, h, 1, 2 * n, 2, self.chunk_size)
+
+            else:
+                midpoint_sum = 0
+
+                for i in range(1, 2 * n, 2):
+                    midpoint_sum += self.fun(self.a + i * h)
 
-        
+            n_eval += n
+            n = 2 * n
 
+            # Richardson extrapolation along the new row of the table
+            current = [previous[0] / 2 + h * midpoint_sum]
+
+            for j in range(1, level + 1):
+                current.append(current[j - 1] + (current[j - 1] - previous[j - 1]) / (4 ** j - 1))
+
+            error = abs(current[level] - previous[level - 1])
+
+            if error < tolerance:
+                if full_output:
+                    return current[level], error, n_eval
+
+                return current[level]
+
+            previous = current
+            level += 1
+
+        raise NotImplementedError(f"Method failed, max level of ({max_level}) reached!")
+
+
+def _grid_sum(fun, a, h, start, stop, step, chunk_size = None):
+    """
+    Sum of f(a + i * h) over i = start, start + step, ... < stop, evaluating f
+    once per chunk of at most `chunk_size` nodes (all nodes at once by default).
+    """
 
+    total = 0
+    count = len(range(start, stop, step))
+    chunk_size = chunk_size or max(count, 1)
 
+    for lower in range(start, stop, step * chunk_size):
 
+        nodes = a + np.arange(lower, min(lower + step * chunk_size, stop), step) * h
+        total += np.sum(np.broadcast_to(fun(nodes), nodes.shape))
 
+    return total
@@ -1,4 +1,7 @@
 from .bisection import Bisection
 from .fixed_point import FixedPoint
 from .newton import Newton
-from .secant import Secant
\ No newline at end of file
+from .secant import Secant
+from .brent import Brent
+from .batch import BatchBisection, BatchNewton, BatchSecant
+from .poly_roots import PolyRoots
\ No newline at end of file
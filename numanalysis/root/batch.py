@@ -0,0 +1,290 @@
+import numpy as np
+from numpy.polynomial import Polynomial as P
+from root.derivative import with_derivative
+from root.horner import Horner
+
+
+class _Lanes:
+
+    """
+    Vectorized callable with the evaluation interface of `Horner`.
+
+    `fun(x, lanes)` receives the points of the evaluated lanes and their indices,
+    so per-lane parameters can be selected as `params[lanes]`.
+    """
+
+    def __init__(self, fun, fun_prime, derivative, m):
+
+        self._fun = fun
+        self._fun_and_prime = with_derivative(fun, fun_prime, derivative)
+        self._all = np.arange(m)
+
+    def __call__(self, x, lanes = None):
+        return self._fun(x, self._all if lanes is None else lanes)
+
+    def both(self, x, lanes = None):
+        return self._fun_and_prime(x, self._all if lanes is None else lanes)
+
+
+class _BatchRootFinder:
+
+    """
+    Common set-up of the batched root finders.
+
+    Parameters
+    ----------
+    polynomials : np.Polynomial, list of np.Polynomial, array_like or callable
+        Either polynomials or a (m, k) array of stacked coefficients in increasing
+        order (as in `Polynomial.coef`). A single polynomial is shared by all lanes.
+        A callable `fun(x, lanes)` is evaluated on the points of the active lanes,
+        where `lanes` holds their indices.
+    fun_prime : callable (optional)
+        Derivative `fun_prime(x, lanes)` of a callable. If omitted, it is computed
+        with `derivative`.
+    derivative : str (optional)
+        "complex_step" or "forward", see `root.derivative`.
+    n_lanes : int (optional)
+        Number of lanes of a callable. By default, the size of the starting values.
+    """
+
+    def __init__(self, polynomials, fun_prime = None, derivative = "complex_step", n_lanes = 1):
+
+        self._callable = callable(polynomials) and not isinstance(polynomials, P)
+
+        if self._callable:
+            self._fun = polynomials
+            self._fun_prime = fun_prime
+            self._derivative = derivative
+            self._n_lanes = n_lanes
+            return
+
+        if isinstance(polynomials, P):
+            polynomials = [polynomials]
+
+        if len(polynomials) and all(isinstance(poly, P) for poly in polynomials):
+            # Pad the coefficients of lower degree polynomials with zeros
+            k = max(len(poly.coef) for poly in polynomials)
+            coefs = np.zeros((len(polynomials), k))
+
+            for i, poly in enumerate(polynomials):
+                coefs[i, :len(poly.coef)] = poly.coef
+
+        else:
+            coefs = np.atleast_2d(np.asarray(polynomials, dtype = float))
+
+        if coefs.ndim != 2:
+            raise ValueError("Coefficients must be a (m, k) array")
+
+        self._coefs = coefs
+
+    def _broadcast(self, *points):
+        """
+        Broadcast the coefficients and the per-lane starting values to m lanes.
+        """
+        if self._callable:
+            m = np.broadcast_shapes((self._n_lanes,), *[np.shape(p) for p in points])[0]
+            horner = _Lanes(self._fun, self._fun_prime, self._derivative, m)
+
+        else:
+            m = np.broadcast_shapes((self._coefs.shape[0],), *[np.shape(p) for p in points])[0]
+            horner = Horner(np.broadcast_to(self._coefs, (m, self._coefs.shape[1])))
+
+        points = [np.array(np.broadcast_to(p, (m,)), dtype = float) for p in points]
+
+        return (horner, *points)
+
+
+class BatchNewton(_BatchRootFinder):
+
+    """
+    Batched Newton Root Finding Method.
+    Solve f_i(x) = 0 for many polynomials (or a vectorized callable) and/or starting
+    points p0_i at once.
+    All lanes are iterated in lock-step with NumPy; lanes that have converged
+    (or whose derivative vanished) are masked out.
+    """
+
+    def fit(self, p0, tolerance = 1e-5, max_iter = 100):
+        '''
+        Parameters:
+        -----------
+        p0 : float or array_like
+            initial point of every lane
+        tolerance : float (optional)
+            acceptable |f(x)|
+        max_iter: int (optional)
+            maximum numer of interations
+
+        Returns
+        -------
+        x : np.ndarray
+            Root of every lane (last iterate if not converged)
+        iterations : np.ndarray
+            Number of Newton steps taken by every lane
+        converged : np.ndarray
+            Whether |f(x)| < tolerance was reached
+        '''
+        horner, x = self._broadcast(p0)
+        m = len(x)
+        iterations = np.zeros(m, dtype = int)
+        converged = np.zeros(m, dtype = bool)
+        active = np.arange(m)
+        iter = 0
+
+        while active.size and iter <= max_iter:
+
+            f, df = horner.both(x[active], active)
+
+            done = np.abs(f) < tolerance
+            converged[active[done]] = True
+
+            # Drop converged lanes and lanes with a zero or non-finite derivative
+            keep = ~done & (df != 0) & np.isfinite(f) & np.isfinite(df)
+            active, f, df = active[keep], f[keep], df[keep]
+
+            if iter == max_iter:
+                break
+
+            x[active] = x[active] - f / df
+            iterations[active] += 1
+            iter += 1
+
+        return x, iterations, converged
+
+
+class BatchSecant(_BatchRootFinder):
+
+    """
+    Batched Secant Method.
+    Solve f_i(x) = 0 for many polynomials and/or pairs of approximations (p0_i, p1_i)
+    at once, iterating all lanes in lock-step.
+    """
+
+    def fit(self, p0, p1, tolerance = 1e-5, max_iter = 100):
+        '''
+        Parameters:
+        -----------
+        p0 : float or array_like
+            First approximation of every lane
+        p1 : float or array_like
+            Second approximation of every lane
+        tolerance: float (optional)
+            Acceptable change between successive approximations
+        max_iter: int (optional)
+            Maximum numer of interations
+
+        Returns
+        -------
+        x : np.ndarray
+            Root of every lane (last iterate if not converged)
+        iterations : np.ndarray
+            Number of secant steps taken by every lane
+        converged : np.ndarray
+            Whether the tolerance was reached
+        '''
+        horner, x0, x1 = self._broadcast(p0, p1)
+        m = len(x0)
+        f0 = horner(x0)
+        iterations = np.zeros(m, dtype = int)
+        converged = np.zeros(m, dtype = bool)
+        active = np.arange(m)
+        iter = 2
+
+        while active.size and iter <= max_iter:
+
+            f1 = horner(x1[active], active)
+            denom = f1 - f0[active]
+
+            # Lanes that hit an exact root or a flat secant stop here
+            exact = f1 == 0
+            converged[active[exact]] = True
+            keep = ~exact & (denom != 0) & np.isfinite(denom)
+            active, f1, denom = active[keep], f1[keep], denom[keep]
+
+            p = x1[active] - f1 * (x1[active] - x0[active]) / denom
+            done = np.abs(p - x1[active]) < tolerance
+
+            # Reparameterize
+            x0[active] = x1[active]
+            f0[active] = f1
+            x1[active] = p
+            iterations[active] += 1
+
+            converged[active[done]] = True
+            active = active[~done]
+            iter += 1
+
+        return x1, iterations, converged
+
+
+class BatchBisection(_BatchRootFinder):
+
+    """
+    Batched Bisection Root Finding Method.
+    Solve f_i(x) = 0 on many intervals [a_i, b_i] with f_i(a_i) * f_i(b_i) < 0 at once.
+    Every iteration evaluates f once per active lane.
+    """
+
+    def fit(self, lower_bound, upper_bound, tolerance = 1e-7, max_iter = 100):
+        """
+        Parameters:
+        -----------
+        lower_bound : float or array_like
+            Interval lower bound of every lane.
+        upper_bound : float or array_like
+            Interval upper bound of every lane.
+        tolerance : float (optional)
+            Acceptable |f(x)|.
+        max_iter : int (optional)
+            Maximum number of iterations.
+
+        Returns:
+        ---------
+        x : np.ndarray
+            Root of every lane (last midpoint if not converged)
+        iterations : np.ndarray
+            Number of bisections of every lane
+        converged : np.ndarray
+            Whether |f(x)| < tolerance was reached
+        """
+        horner, lower, upper = self._broadcast(lower_bound, upper_bound)
+        m = len(lower)
+        f_lower = horner(lower)
+        f_upper = horner(upper)
+
+        if np.any(f_lower * f_upper > 0):
+            raise ValueError("Please use valid endpoints such that f(a) * f(b) < 0")
+
+        x = (lower + upper) / 2
+        iterations = np.zeros(m, dtype = int)
+        converged = np.zeros(m, dtype = bool)
+
+        # A root at an endpoint is already found
+        at_lower = f_lower == 0
+        at_upper = (f_upper == 0) & ~at_lower
+        x[at_lower] = lower[at_lower]
+        x[at_upper] = upper[at_upper]
+        converged[at_lower | at_upper] = True
+
+        active = np.nonzero(~converged)[0]
+        iter = 1
+
+        while active.size and iter <= max_iter:
+
+            midpoint = (lower[active] + upper[active]) / 2
+            f_mid = horner(midpoint, active)
+            x[active] = midpoint
+            iterations[active] += 1
+
+            # Keep the half interval where f changes sign
+            same_sign = np.sign(f_mid) == np.sign(f_lower[active])
+            lower[active[same_sign]] = midpoint[same_sign]
+            f_lower[active[same_sign]] = f_mid[same_sign]
+            upper[active[~same_sign]] = midpoint[~same_sign]
+
+            done = np.abs(f_mid) < tolerance
+            converged[active[done]] = True
+            active = active[~done]
+            iter += 1
+
+        return x, iterations, converged
@@ -1,4 +1,5 @@
 import numpy as np
+from root.horner import Horner
 
 class Bisection:
 
@@ -10,27 +11,8 @@ class Bisection:
         if "numpy.polynomial.polynomial.Polynomial" not in str(type(self._polynomial)):
             raise TypeError("Polynomial must be of type `numpy.polynomial.polynomial.Polynomial`")
 
-
-    def _fun(self, x: float):
-        """
-        Express polynomial as a function
-
-        Parameter
-        ----------
-
-        x: float
-            The value that the polynomial takes.
-        
-        Returns
-        --------
-
-        float: float
-            The value of the polynomial at x.
-
-        """
-        return sum([a * x ** i for i, a in enumerate(self._polynomial.coef)])
-    
-
+        # Polynomial as a function, evaluated with Horner's scheme
+        self._fun = Horner(self._polynomial)
 
     def fit(self, lower_bound :float, upper_bound :float,  tolerance = 1e-7, max_iter = 100) -> float:
 
@@ -59,27 +41,26 @@ class Bisection:
     
         """
 
-        if self._fun(lower_bound) * self._fun(upper_bound) < 0: 
+        fun_lower = self._fun(lower_bound)
+        fun_upper = self._fun(upper_bound)
 
+        if fun_lower * fun_upper < 0: 
+
+            # Orient f so that f(lower_bound) < 0 < f(upper_bound)
+            sign = 1 if fun_lower < fun_upper else -1
             iter = 1
 
             while iter <= max_iter:
-                if self._fun(lower_bound) > self._fun(upper_bound):
-                    self._fun = - self._fun
 
                 midpoint = (lower_bound + upper_bound) / 2 
+                fun_midpoint = sign * self._fun(midpoint)
 
                 # check tolerance level
 
-                if abs(self._fun(midpoint)) < tolerance: 
-                    return midpoint
-                    
-
-                elif self._fun(midpoint) == 0:
+                if abs(fun_midpoint) < tolerance: 
                     return midpoint
-                    
 
-                elif self._fun(midpoint) > 0:
+                elif fun_midpoint > 0:
                     upper_bound = midpoint
 
                 else:
@@ -0,0 +1,148 @@
+import math
+
+import numpy as np
+from numpy.polynomial import Polynomial as P
+from root.horner import Horner
+
+class Brent:
+
+    def __init__(self, fun):
+
+        '''
+        Brent's Root Finding Method.
+        Finding a solution to f(x) = 0 given an interval [a,b] where
+        f(a) and f(b) have opposite signs.
+
+        Every iteration takes an inverse quadratic interpolation or secant step when
+        it stays inside the bracket and shrinks it fast enough, and a bisection step
+        otherwise. Convergence is therefore guaranteed like Bisection, but superlinear
+        for smooth f, and f is evaluated exactly once per iteration.
+
+        Parameters:
+        -----------
+        fun : np.Polynomial or callable
+            Function of the form f(x) = 0
+
+        Reference:
+        Brent, R. P. (1973). Algorithms for Minimization without Derivatives. Prentice-Hall.
+        '''
+
+        if isinstance(fun, P):
+            # Polynomial as a function, evaluated with Horner's scheme
+            self._fun = Horner(fun)
+
+        elif callable(fun):
+            self._fun = fun
+
+        else:
+            raise TypeError("fun must be a callable or of type `numpy.polynomial.polynomial.Polynomial`")
+
+        self.n_eval = 0
+
+    def _eval(self, x):
+        self.n_eval += 1
+        return self._fun(x)
+
+    def fit(self, lower_bound :float, upper_bound :float, tolerance = 1e-7, max_iter = 100, full_output = False):
+
+        """
+        Parameters:
+        -----------
+        lower_bound : float
+            Interval lower bound.
+        upper_bound : float
+            Interval upper bound.
+        tolerance : float (optional)
+            Acceptable error level of the root.
+        max_iter : int (optional)
+            Maximum number of iterations.
+        full_output : bool (optional)
+            Also return the number of iterations and of function evaluations.
+
+        Returns:
+        ---------
+        x : float
+            Root of the equation f(x) = 0.
+        iterations : int
+            Number of iterations, only if `full_output`.
+        n_eval : int
+            Number of evaluations of f, only if `full_output`.
+        """
+
+        self.n_eval = 0
+        a, b = lower_bound, upper_bound
+        fun_a, fun_b = self._eval(a), self._eval(b)
+
+        if fun_a * fun_b > 0:
+            raise ValueError("Please use valid endpoints such that f(a) * f(b) < 0")
+
+        if fun_a == 0:
+            b, fun_b = a, fun_a
+
+        # b is the best approximation, [b, c] brackets the root and a is the previous b
+        c, fun_c = a, fun_a
+        d = e = b - a
+        iter = 0
+
+        while iter <= max_iter:
+
+            if fun_b * fun_c > 0:
+                c, fun_c = a, fun_a
+                d = e = b - a
+
+            if abs(fun_c) < abs(fun_b):
+                a, b, c = b, c, b
+                fun_a, fun_b, fun_c = fun_b, fun_c, fun_b
+
+            tol = 2 * np.finfo(float).eps * abs(b) + tolerance / 2
+            midpoint = (c - b) / 2
+
+            # check tolerance level
+            if abs(midpoint) <= tol or fun_b == 0:
+                if full_output:
+                    return b, iter, self.n_eval
+
+                return b
+
+            if iter == max_iter:
+                break
+
+            if abs(e) >= tol and abs(fun_a) > abs(fun_b):
+                s = fun_b / fun_a
+
+                if a == c:
+                    # Secant step
+                    p = 2 * midpoint * s
+                    q = 1 - s
+
+                else:
+                    # Inverse quadratic interpolation step
+                    q = fun_a / fun_c
+                    r = fun_b / fun_c
+                    p = s * (2 * midpoint * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+
+                if p > 0:
+                    q = -q
+
+                p = abs(p)
+
+                if 2 * p < min(3 * midpoint * q - abs(tol * q), abs(e * q)):
+                    e = d
+                    d = p / q
+
+                else:
+                    # Interpolation is not shrinking the bracket, bisect instead
+                    d = midpoint
+                    e = d
+
+            else:
+                d = midpoint
+                e = d
+
+            a, fun_a = b, fun_b
+            b += d if abs(d) > tol else math.copysign(tol, midpoint)
+            fun_b = self._eval(b)
+            iter += 1
+
+        raise NotImplementedError(f"Method Failed, max iterations ({max_iter}) reached!")
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def complex_step(fun, h = 1e-20):
+    """
+    f(x) and f'(x) from a single complex evaluation,
+    f(x + ih) = f(x) + ih f'(x) + O(h^2), so f(x) = Re f(x + ih) and f'(x) = Im f(x + ih) / h.
+    There is no subtraction, so h can be tiny and f'(x) is exact to machine precision.
+    Requires f to be analytic and written with complex-safe NumPy operations (no abs, no comparisons).
+
+    Parameters
+    ----------
+    fun : callable
+        f(x, *args), scalar or vectorized
+    h : float (optional)
+        Imaginary step
+
+    Returns
+    -------
+    fun_and_prime : callable
+        (x, *args) -> (f(x), f'(x))
+    """
+
+    def fun_and_prime(x, *args):
+        z = fun(x + 1j * h, *args)
+        return np.real(z), np.imag(z) / h
+
+    return fun_and_prime
+
+
+def forward_difference(fun):
+    """
+    f(x) and the forward difference (f(x + h) - f(x)) / h, with h = sqrt(eps) max(|x|, 1).
+    Two evaluations and about half the digits of f'(x), but works for any real f.
+
+    Parameters
+    ----------
+    fun : callable
+        f(x, *args), scalar or vectorized
+
+    Returns
+    -------
+    fun_and_prime : callable
+        (x, *args) -> (f(x), f'(x))
+    """
+
+    def fun_and_prime(x, *args):
+        f = fun(x, *args)
+        h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1)
+        return f, (fun(x + h, *args) - f) / h
+
+    return fun_and_prime
+
+
+def with_derivative(fun, fun_prime = None, derivative = "complex_step"):
+    """
+    f(x) and f'(x) in one call, from a user derivative or an automatic estimate.
+    """
+
+    if fun_prime is not None:
+        return lambda x, *args: (fun(x, *args), fun_prime(x, *args))
+
+    if derivative == "complex_step":
+        return complex_step(fun)
+
+    if derivative == "forward":
+        return forward_difference(fun)
+
+    raise ValueError("Invalid derivative. Choose from: ['complex_step', 'forward']")
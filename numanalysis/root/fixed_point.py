@@ -1,6 +1,7 @@
 
 import numpy as np
-import sympy
+from numpy.polynomial import Polynomial as P
+from root.horner import Horner
 
 class FixedPoint:
         
@@ -26,51 +27,180 @@ class FixedPoint:
 
         if self.expr_type == "polynomial":
 
-            if "numpy.polynomial.polynomial.Polynomial" not in str(type(self._polynomial)):
+            if not isinstance(self.expr, P):
                 raise TypeError("Polynomial must be of type `numpy.polynomial.polynomial.Polynomial`")
             
-            self.x = sympy.symbols("x")
-            self._sympy_poly = sum([a * self.x ** i for i, a in enumerate(self.expr.coef)])
-            self._fun = lambda eval: self._sympy_poly.subs(self.x, eval).evalf()
+            # Polynomial as a function, evaluated with Horner's scheme
+            self._fun = Horner(self.expr)
         
         elif self.expr_type == "function":
             self._fun = self.expr
         
         else:
             raise ValueError("Invalid expr_type. Choose from: ['function', 'polynomial']")
+
+        self.n_eval = 0
     
-    def fit(self, p0 :float,  tolerance = 1e-7, max_iter = 100) -> float:
+    def _eval(self, p):
+        self.n_eval += 1
+        return self._fun(p)
+
+    @staticmethod
+    def _norm(step):
+        # max norm, so that vector-valued g(p) works like scalar g(p)
+        return float(np.max(np.abs(step)))
+
+    @staticmethod
+    def _delta2(p0, p1, p2):
+        """
+        Aitken's delta-squared extrapolation p0 - (p1 - p0)^2 / (p2 - 2 p1 + p0),
+        componentwise, falling back to p2 where the second difference vanishes.
+        """
+        p0, p1, p2 = np.asarray(p0, dtype = float), np.asarray(p1, dtype = float), np.asarray(p2, dtype = float)
+        denom = p2 - 2 * p1 + p0
+
+        with np.errstate(all = "ignore"):
+            p = p0 - (p1 - p0) ** 2 / denom
+
+        return np.where((denom != 0) & np.isfinite(p), p, p2)
+
+    def fit(self, p0, tolerance = 1e-7, max_iter = 100, method = "plain", m = 5, full_output = False):
 
         ''' 
         Parameters:
         -----------
-        _fun : polynomial function
-            function of the form g(p) = p
-        p0 : float
+        p0 : float or np.ndarray
             initial point
         tolerance  : float (optional)
             acceptable error level
         max_iter: int (optional)
             maximum numer of interations
+        method : str (optional)
+            "plain"      - p = g(p)
+            "aitken"     - Aitken's delta-squared extrapolation of the plain iterates
+            "steffensen" - Steffensen's method, restarting the plain iteration from
+                           every extrapolated point (quadratic convergence)
+            "anderson"   - Anderson mixing of the last `m` iterates, for vector-valued g
+            "aitken" and "steffensen" extrapolate componentwise, which suits scalar g
+            and uncoupled components.
+        m : int (optional)
+            number of previous iterates mixed by "anderson"
+        full_output : bool (optional)
+            also return the number of iterations and the residual history
 
-        
         Returns:
         -------
-        p : float
+        p : float or np.ndarray
             Solution to the equation g(p) = p.
+        iterations : int
+            Number of iterations, only if `full_output`.
+        residuals : np.ndarray
+            Step size |p_k+1 - p_k| (max norm) of every iteration, only if `full_output`.
 
+        The number of evaluations of g is stored in `n_eval`.
         '''
 
-        iter = 0
-        p = self._fun(p0)
+        if method not in ("plain", "aitken", "steffensen", "anderson"):
+            raise ValueError("Invalid method. Choose from: ['plain', 'aitken', 'steffensen', 'anderson']")
+
+        self.n_eval = 0
+        p, residuals = getattr(self, "_" + method)(p0, tolerance, max_iter, m)
+
+        if not residuals or residuals[-1] >= tolerance:
+            raise NotImplementedError(f"Method failed, max iterations of ({max_iter}) reached!")
+
+        if np.ndim(p) == 0:
+            p = float(p)
+
+        if full_output:
+            return p, len(residuals), np.array(residuals)
+
+        return p
+
+    def _plain(self, p0, tolerance, max_iter, m):
+
+        residuals = []
+        p = self._eval(p0)
+
+        while len(residuals) < max_iter:
+            residuals.append(self._norm(p - p0))
+
+            if residuals[-1] < tolerance:
+                break
+
+            p0 = p
+            p = self._eval(p0)
+
+        return p, residuals
+
+    def _aitken(self, p0, tolerance, max_iter, m):
+
+        residuals = []
+        p1 = self._eval(p0)
+        p2 = self._eval(p1)
+        q = q0 = self._delta2(p0, p1, p2)
+
+        while len(residuals) < max_iter:
+
+            # Extrapolate the next triple of plain iterates
+            p0, p1, p2 = p1, p2, self._eval(p2)
+            q = self._delta2(p0, p1, p2)
+            residuals.append(self._norm(q - q0))
+
+            if residuals[-1] < tolerance:
+                break
+
+            q0 = q
+
+        return q, residuals
+
+    def _steffensen(self, p0, tolerance, max_iter, m):
+
+        residuals = []
+        p = p0
+
+        while len(residuals) < max_iter:
+            p1 = self._eval(p0)
+            p2 = self._eval(p1)
+            p = self._delta2(p0, p1, p2)
+            residuals.append(self._norm(p - p0))
+
+            if residuals[-1] < tolerance:
+                break
 
-        while iter < max_iter:
-            if abs(p - p0) < tolerance:
-                return p   
-            
             p0 = p
-            p = self._fun(p0)
-            iter += 1
 
-            if iter == max_iter:
-                raise NotImplementedError(f"Method failed, max iterations of ({max_iter}) reached!")
\ No newline at end of file
+        return p, residuals
+
+    def _anderson(self, p0, tolerance, max_iter, m):
+
+        shape = np.shape(p0)
+        x = np.array(p0, dtype = float).ravel()
+        g = np.asarray(self._eval(x.reshape(shape)), dtype = float).ravel()
+        f = g - x
+        delta_f, delta_g = [], []
+        residuals = []
+
+        while len(residuals) < max_iter:
+            residuals.append(self._norm(f))
+
+            if residuals[-1] < tolerance:
+                break
+
+            if delta_f:
+                # Mix the last m iterates: minimize |f - dF gamma| over gamma
+                gamma = np.linalg.lstsq(np.column_stack(delta_f), f, rcond = None)[0]
+                x = g - np.column_stack(delta_g) @ gamma
+
+            else:
+                x = g
+
+            g_new = np.asarray(self._eval(x.reshape(shape)), dtype = float).ravel()
+            f_new = g_new - x
+
+            delta_f.append(f_new - f)
+            delta_g.append(g_new - g)
+            delta_f, delta_g = delta_f[-m:], delta_g[-m:]
+            f, g = f_new, g_new
+
+        return g.reshape(shape), residuals
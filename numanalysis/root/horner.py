@@ -0,0 +1,116 @@
+import numbers
+
+import numpy as np
+from numpy.polynomial import Polynomial as P
+
+
+class Horner:
+
+    """
+    Polynomial evaluator shared by the root finders.
+
+    The coefficients and the coefficients of the derivative are extracted once, and
+    the polynomial is evaluated with Horner's scheme,
+    p(x) = c0 + x (c1 + x (c2 + ... + x cn)),
+    which needs n multiplications and no powers. Scalars are evaluated with plain
+    Python floats; arrays are evaluated with NumPy.
+
+    Parameters
+    ----------
+    polynomial : np.Polynomial or array_like
+        Polynomial, or coefficients in increasing order. A (m, k) array holds m stacked
+        polynomials, evaluated one point per row.
+    """
+
+    def __init__(self, polynomial):
+
+        if isinstance(polynomial, P):
+            coef = np.array(polynomial.coef, dtype = float)
+
+        else:
+            coef = np.array(polynomial, dtype = float)
+
+        if coef.shape[-1] == 0:
+            coef = np.zeros(coef.shape[:-1] + (1,))
+
+        self.coef = coef
+        self.deriv_coef = coef[..., 1:] * np.arange(1, coef.shape[-1])
+
+        if coef.ndim == 1:
+            self._coef_list = coef.tolist()
+            self._deriv_list = self.deriv_coef.tolist()
+
+    @staticmethod
+    def _scalar(x, lanes):
+        return lanes is None and isinstance(x, numbers.Number)
+
+    def __call__(self, x, lanes = None):
+        """
+        p(x). With stacked polynomials, `lanes` selects the rows evaluated at x.
+        """
+        if self.coef.ndim == 1 and self._scalar(x, lanes):
+            return self._eval_list(self._coef_list, x)
+
+        return self._eval_array(self._rows(self.coef, lanes), x)
+
+    def prime(self, x, lanes = None):
+        """
+        p'(x), from the cached derivative coefficients.
+        """
+        if self.coef.ndim == 1 and self._scalar(x, lanes):
+            return self._eval_list(self._deriv_list, x) if self._deriv_list else 0.0
+
+        deriv_coef = self._rows(self.deriv_coef, lanes)
+
+        if deriv_coef.shape[-1] == 0:
+            return np.zeros(np.broadcast_shapes(np.shape(x), deriv_coef.shape[:-1]))
+
+        return self._eval_array(deriv_coef, x)
+
+    def both(self, x, lanes = None):
+        """
+        p(x) and p'(x) in a single Horner pass.
+        """
+        if self.coef.ndim == 1 and self._scalar(x, lanes):
+            coef = self._coef_list
+            p = coef[-1]
+            dp = 0.0
+
+            for c in coef[-2::-1]:
+                dp = dp * x + p
+                p = p * x + c
+
+            return p, dp
+
+        coef = self._rows(self.coef, lanes)
+        p = coef[..., -1]
+        dp = np.zeros_like(p)
+
+        for i in range(coef.shape[-1] - 2, -1, -1):
+            dp = dp * x + p
+            p = p * x + coef[..., i]
+
+        return p, dp
+
+    @staticmethod
+    def _rows(coef, lanes):
+        return coef if lanes is None else coef[lanes]
+
+    @staticmethod
+    def _eval_list(coef, x):
+        p = coef[-1]
+
+        for c in coef[-2::-1]:
+            p = p * x + c
+
+        return p
+
+    @staticmethod
+    def _eval_array(coef, x):
+        x = np.asarray(x)
+        p = coef[..., -1]
+
+        for i in range(coef.shape[-1] - 2, -1, -1):
+            p = p * x + coef[..., i]
+
+        return p
@@ -1,48 +1,38 @@
 import numpy as np
+from numpy.polynomial import Polynomial as P
+from root.derivative import with_derivative
+from root.horner import Horner
 
 class Newton:
         
-    def __init__(self, polynomial):
-
-        self._polynomial = polynomial
-
-        # validate the polynomial class
-        if "numpy.polynomial.polynomial.Polynomial" not in str(type(self._polynomial)):
-            raise TypeError("Polynomial must be of type `numpy.polynomial.polynomial.Polynomial`")
-
-
-    def _fun(self, x: float):
-        """
-        Express polynomial as a function
-        Parameter
-        ----------
-        x: float
-            The value that the polynomial takes.       
-        Returns
-        --------
-        float: float
-            The value of the polynomial at x.
-
-        """
-
-        return sum([a * x ** i for i, a in enumerate(self._polynomial.coef)])
-    
-    def _fun_prime(self, x: float):
-        """
-        Calcuate f'(x)
-
-        Parameter
-        ----------
-        x: float
-            Evaluating polynomial derivate at x.       
-        Returns
-        --------
-        float: float
-            The value of the derivate at x.
-        """
-        
-        return sum([(a * i) * x ** (i - 1) if i > 0 else 0 for i, a in enumerate(self._polynomial.coef)])
+    def __init__(self, fun, fun_prime = None, derivative = "complex_step"):
 
+        '''
+        Parameters:
+        -----------
+        fun : np.Polynomial or callable
+            Function of the form f(x) = 0
+        fun_prime : callable (optional)
+            Derivative f'(x). If omitted, it is computed from `fun` with `derivative`
+        derivative : str (optional)
+            "complex_step" (f'(x) = Im f(x + ih) / h, exact for analytic f, one evaluation)
+            or "forward" (forward difference, for any real f)
+        '''
+
+        if isinstance(fun, P):
+            # Polynomial and its derivative, evaluated with Horner's scheme
+            self._horner = Horner(fun)
+            self._fun = self._horner
+            self._fun_prime = self._horner.prime
+            self._fun_and_prime = self._horner.both
+
+        elif callable(fun):
+            self._fun = fun
+            self._fun_and_prime = with_derivative(fun, fun_prime, derivative)
+            self._fun_prime = fun_prime if fun_prime is not None else lambda x: self._fun_and_prime(x)[1]
+
+        else:
+            raise TypeError("fun must be a callable or of type `numpy.polynomial.polynomial.Polynomial`")
 
     def fit(self, p0 :float,  tolerance = 1e-5, max_iter = 100):
         ''' 
@@ -52,8 +42,6 @@ class Newton:
         
         Parameters:
         -----------
-        fun : polynomial function
-            function of the form f(x) = 0
         p0 : float
             initial point
         tolerance : float(optional)
@@ -67,12 +55,16 @@ class Newton:
             Root of the equation f(x) = 0
         '''    
         iter = 0
+        fun_p0, fun_prime_p0 = self._fun_and_prime(p0)
 
         while iter <= max_iter:
 
-            p = p0 - (self._fun(p0) / self._fun_prime(p0))
+            p = p0 - (fun_p0 / fun_prime_p0)
+
+            # f(p) and f'(p) are reused by the next step
+            fun_p0, fun_prime_p0 = self._fun_and_prime(p)
 
-            if self._fun(p) == 0 or abs(self._fun(p)) < tolerance:
+            if fun_p0 == 0 or abs(fun_p0) < tolerance:
                 return p
 
             iter += 1 
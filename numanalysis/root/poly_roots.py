@@ -0,0 +1,201 @@
+import numpy as np
+from numpy.polynomial import Polynomial as P
+from root.batch import _BatchRootFinder
+from root.horner import Horner
+
+
+class PolyRoots(_BatchRootFinder):
+
+    """
+    All real and complex roots of one or many polynomials at once.
+
+    "companion" : Eigenvalues of the companion matrix of the monic polynomial. All
+                  polynomials are stacked into one (m, n, n) batch of matrices.
+    "aberth"    : Aberth-Ehrlich simultaneous iteration. Every root is refined at once,
+                  z_k <- z_k - w_k, w_k = r_k / (1 - r_k sum_{j != k} 1 / (z_k - z_j)),
+                  with the Newton correction r_k = p(z_k) / p'(z_k), for all polynomials
+                  in lock-step.
+
+    Parameters
+    ----------
+    polynomials : np.Polynomial, list of np.Polynomial or array_like
+        A polynomial, polynomials of the same degree, or coefficients in increasing
+        order, (k,) for one polynomial or (m, k) for m stacked polynomials.
+
+    Reference:
+    Aberth, O. (1973). Iteration Methods for Finding all Zeros of a Polynomial Simultaneously.
+    Mathematics of Computation, 27(122), 339-344.
+    """
+
+    def __init__(self, polynomials):
+
+        # np.ndim would read a list of polynomials as one coefficient vector
+        listed = isinstance(polynomials, (list, tuple)) and len(polynomials) > 0 and \
+            all(isinstance(poly, P) for poly in polynomials)
+        single = isinstance(polynomials, P) or (not listed and np.ndim(polynomials) == 1)
+
+        if isinstance(polynomials, P):
+            polynomials = polynomials.trim()
+
+        elif listed:
+            polynomials = [poly.trim() for poly in polynomials]
+
+        elif single:
+            polynomials = P(polynomials).trim().coef
+
+        super().__init__(polynomials)
+
+        if self._callable:
+            raise TypeError("Polynomials must be of type `numpy.polynomial.polynomial.Polynomial` or coefficients")
+
+        self._single = single
+
+        if self._coefs.shape[1] < 2:
+            raise ValueError("Polynomial degree should be atleast 1")
+
+        if np.any(self._coefs[:, -1] == 0):
+            raise ValueError("Leading coefficients must be nonzero (stack polynomials of the same degree)")
+
+    def fit(self, method = "companion", polish = True, tolerance = 1e-12, max_iter = 100, full_output = False):
+        """
+        Parameters
+        ----------
+        method : str (optional)
+            "companion" or "aberth"
+        polish : bool (optional)
+            Refine every root with a few Newton steps on the original coefficients
+        tolerance : float (optional)
+            Acceptable relative correction for the Aberth iteration and polishing
+        max_iter : int (optional)
+            Maximum number of Aberth iterations
+        full_output : bool (optional)
+            Also return the iteration counts and convergence flags of every polynomial
+
+        Returns
+        -------
+        roots : np.ndarray
+            Complex roots sorted by real then imaginary part, (n,) for a single
+            polynomial of degree n, or (m, n) for m polynomials
+        iterations : np.ndarray
+            Number of Aberth iterations per polynomial (0 for "companion"), only if `full_output`
+        converged : np.ndarray
+            Whether all roots of the polynomial converged, only if `full_output`
+        """
+
+        if method == "companion":
+            roots = self._companion()
+            iterations = np.zeros(len(roots), dtype = int)
+            converged = np.all(np.isfinite(roots), axis = 1)
+
+        elif method == "aberth":
+            roots, iterations, converged = self._aberth(tolerance, max_iter)
+
+        else:
+            raise ValueError("Invalid method. Choose from: ['companion', 'aberth']")
+
+        if polish:
+            roots = self._polish(roots, tolerance)
+
+        # Real coefficients: drop the round-off imaginary part of real roots
+        near_real = np.abs(roots.imag) <= tolerance * np.maximum(np.abs(roots), 1)
+        roots = np.where(near_real, roots.real + 0j, roots)
+
+        roots = np.sort(roots, axis = 1)
+
+        if self._single:
+            roots = roots[0]
+            iterations = iterations[0]
+            converged = converged[0]
+
+        if full_output:
+            return roots, iterations, converged
+
+        return roots
+
+    def _companion(self):
+
+        m, k = self._coefs.shape
+        n = k - 1
+
+        # Companion matrix of the monic polynomial x^n + a_{n-1} x^{n-1} + ... + a_0
+        monic = self._coefs[:, :-1] / self._coefs[:, -1:]
+        companion = np.zeros((m, n, n))
+        companion[:, np.arange(1, n), np.arange(n - 1)] = 1
+        companion[:, :, -1] = - monic
+
+        return np.linalg.eigvals(companion).astype(complex)
+
+    def _evaluate(self, horner, z):
+        """
+        p(z) and p'(z) for a (m, n) array of points, the i-th row on the i-th polynomial.
+        """
+        p, dp = horner.both(z.T)
+        return p.T, dp.T
+
+    def _aberth(self, tolerance, max_iter):
+
+        m, k = self._coefs.shape
+        n = k - 1
+        horner = Horner(self._coefs)
+
+        # Start on a circle enclosing the roots, with an offset to break symmetry
+        monic = np.abs(self._coefs[:, :-1] / self._coefs[:, -1:])
+        radius = 2 * np.max(monic ** (1 / np.arange(n, 0, -1)), axis = 1)
+        radius[radius == 0] = 1
+        angles = 2 * np.pi * np.arange(n) / n + 0.4
+        z = radius[:, np.newaxis] * np.exp(1j * angles)
+
+        iterations = np.zeros(m, dtype = int)
+        active = np.ones((m, n), dtype = bool)
+        iter = 0
+
+        while iter < max_iter and active.any():
+
+            p, dp = self._evaluate(horner, z)
+
+            with np.errstate(divide = "ignore", invalid = "ignore"):
+                ratio = p / dp
+
+                diff = z[:, :, np.newaxis] - z[:, np.newaxis, :]
+                diff[:, np.arange(n), np.arange(n)] = np.inf
+                repulsion = np.sum(1 / diff, axis = 2)
+
+                step = ratio / (1 - ratio * repulsion)
+
+            # Exact roots (p = 0) need no correction
+            step[p == 0] = 0
+            step[~active] = 0
+            step[~np.isfinite(step)] = 0
+
+            z = z - step
+            iterations[active.any(axis = 1)] += 1
+            active &= np.abs(step) > tolerance * np.maximum(np.abs(z), 1)
+            iter += 1
+
+        return z, iterations, ~active.any(axis = 1)
+
+    def _polish(self, roots, tolerance, steps = 3):
+
+        horner = Horner(self._coefs)
+
+        for _ in range(steps):
+
+            p, dp = self._evaluate(horner, roots)
+
+            with np.errstate(divide = "ignore", invalid = "ignore"):
+                step = p / dp
+
+            # Multiple roots (p' = 0) are left unchanged
+            step[~np.isfinite(step)] = 0
+
+            candidate = roots - step
+
+            # Keep a Newton step only if it reduces |p|
+            p_candidate, _ = self._evaluate(horner, candidate)
+            better = np.abs(p_candidate) < np.abs(p)
+            roots = np.where(better, candidate, roots)
+
+            if np.all(np.abs(step) <= tolerance * np.maximum(np.abs(roots), 1)):
+                break
+
+        return roots
@@ -1,30 +1,26 @@
+from numpy.polynomial import Polynomial as P
+from root.horner import Horner
 
 class Secant:
         
-    def __init__(self, polynomial):
+    def __init__(self, fun):
 
-        self._polynomial = polynomial
-
-        # validate the polynomial class
-        if "numpy.polynomial.polynomial.Polynomial" not in str(type(self._polynomial)):
-            raise TypeError("Polynomial must be of type `numpy.polynomial.polynomial.Polynomial`")
+        '''
+        Parameters:
+        -----------
+        fun : np.Polynomial or callable
+            Function of the form f(x) = 0
+        '''
 
+        if isinstance(fun, P):
+            # Polynomial as a function, evaluated with Horner's scheme
+            self._fun = Horner(fun)
 
-    def _fun(self, x: float):
-        """
-        Express polynomial as a function
-        Parameter
-        ----------
-        x: float
-            The value that the polynomial takes.       
-        Returns
-        --------
-        float: float
-            The value of the polynomial at x.
+        elif callable(fun):
+            self._fun = fun
 
-        """
-        return sum([a * x ** i for i, a in enumerate(self._polynomial.coef)])
-    
+        else:
+            raise TypeError("fun must be a callable or of type `numpy.polynomial.polynomial.Polynomial`")
 
     def fit(self, p0 :float,  p1 :float, tolerance = 1e-5, max_iter = 100) -> float:
 
@@ -35,8 +31,6 @@ class Secant:
         
         Parameters:
         -----------
-        fun : function 
-            Polynomial function of the form f(x) = 0
         p0 : float
             First approximation
         p1 : float
@@ -53,14 +47,16 @@ class Secant:
         '''
 
         fun_p0 = self._fun(p0)
+        fun_p1 = self._fun(p1)
         iter = 2
         while iter <= max_iter:
 
-            fun_p1 = self._fun(p1)
-
             p = p1 - (fun_p1 * (p1 - p0)) / (fun_p1 - fun_p0)
 
-            if self._fun(p) == 0 or abs(p - p0) < tolerance:
+            # f(p) is reused as f(p1) by the next step
+            fun_p = self._fun(p)
+
+            if fun_p == 0 or abs(p - p0) < tolerance:
                 return p
             
             iter += 1
@@ -69,6 +65,7 @@ class Secant:
             p0 = p1
             fun_p0 = fun_p1
             p1 = p
+            fun_p1 = fun_p
 
             if iter == max_iter:
                 raise NotImplementedError(f"Method Failed, max iterations of ({max_iter}) reached!")
\ No newline at end of file
@@ -1,8 +1,10 @@
+import os
+import tempfile
 import unittest
 import numpy as np
 import sys
 sys.path.append('numanalysis')
-import root, interpolate, quad, least_squares
+import root, interpolate, quad, polynomial, least_squares
 
 class TestRootFinding(unittest.TestCase):
     def test_bisection(self):
@@ -18,6 +20,32 @@ class TestRootFinding(unittest.TestCase):
         result = root.FixedPoint(expr = func, expr_type = "function").fit(1.5)
         self.assertAlmostEqual(result, 1.365230013, delta = 1e-3)
 
+    def test_accelerated_fixed_point(self):
+        # Test cases for Aitken, Steffensen and Anderson acceleration of a slow contraction
+        func = lambda x: x - 0.01 * (x ** 3 - 2)
+        plain = root.FixedPoint(func, "function")
+        plain.fit(1.0, tolerance = 1e-10, max_iter = 1000)
+
+        for method in ["aitken", "steffensen", "anderson"]:
+            fixed_point = root.FixedPoint(func, "function")
+            result, iterations, residuals = fixed_point.fit(1.0, tolerance = 1e-10, max_iter = 1000,
+                                                            method = method, full_output = True)
+            self.assertAlmostEqual(result, 2 ** (1 / 3), delta = 1e-8)
+            self.assertEqual(len(residuals), iterations)
+            self.assertLess(fixed_point.n_eval, plain.n_eval / 2)
+
+        # Vector-valued g: Richardson iteration for A x = b
+        A = np.diag(np.linspace(1, 100, 20))
+        b = np.ones(20)
+        func = lambda x: x - 0.0099 * (A @ x - b)
+        fixed_point = root.FixedPoint(func, "function")
+        result = fixed_point.fit(np.zeros(20), tolerance = 1e-10, max_iter = 1000, method = "anderson", m = 10)
+        self.assertTrue(np.allclose(result, b / np.diag(A), atol = 1e-7))
+        self.assertLess(fixed_point.n_eval, 200)
+
+        with self.assertRaises(NotImplementedError):
+            root.FixedPoint(func, "function").fit(np.zeros(20), max_iter = 10)
+
     def test_newton(self):
         # Test cases for Newton's method
         polynomial = np.polynomial.Polynomial([-5, -2, 0, 2])
@@ -30,6 +58,106 @@ class TestRootFinding(unittest.TestCase):
         result = root.Secant(polynomial).fit(3, 4)
         self.assertAlmostEqual(result, 1.6006, delta = 1e-3)
 
+    def test_brent(self):
+        # Test cases for Brent's method with polynomials and general callables
+        polynomial = np.polynomial.Polynomial([-4, 0, 1])
+        result = root.Brent(polynomial).fit(0, 3)
+        self.assertAlmostEqual(result, 2.0, delta = 1e-6)
+
+        func = lambda x: np.cos(x) - x
+        result, iterations, n_eval = root.Brent(func).fit(0, 1, tolerance = 1e-12, full_output = True)
+        self.assertAlmostEqual(result, 0.7390851332151607, delta = 1e-12)
+        self.assertEqual(n_eval, iterations + 2)
+        self.assertLess(n_eval, 15)
+
+        with self.assertRaises(ValueError):
+            root.Brent(func).fit(1, 2)
+
+    def test_horner(self):
+        # Test cases for the shared Horner evaluator and the solvers built on it
+        polynomial = np.polynomial.Polynomial([-5, -2, 0, 2])
+        horner = root.horner.Horner(polynomial)
+        x = np.linspace(-2, 2, 9)
+        self.assertTrue(np.allclose(horner(x), polynomial(x)))
+        self.assertTrue(np.allclose(horner.prime(x), polynomial.deriv()(x)))
+        self.assertEqual(horner.both(1.5), (polynomial(1.5), polynomial.deriv()(1.5)))
+
+        result = root.Bisection(np.polynomial.Polynomial([4, 0, -1])).fit(0, 3)
+        self.assertAlmostEqual(result, 2.0, delta = 1e-3)
+
+        result = root.FixedPoint(np.polynomial.Polynomial([1, 0.5]), expr_type = "polynomial").fit(0.0)
+        self.assertAlmostEqual(result, 2.0, delta = 1e-3)
+
+    def test_batch_root_finding(self):
+        # Test cases for solving many polynomials at once: x ** 3 - r ** 3 = 0
+        r = np.linspace(1, 3, 500)
+        coefs = np.zeros((len(r), 4))
+        coefs[:, 0] = - r ** 3
+        coefs[:, 3] = 1
+
+        results = [root.BatchNewton(coefs).fit(2.0, tolerance = 1e-10),
+                   root.BatchSecant(coefs).fit(1.0, 4.0, tolerance = 1e-10),
+                   root.BatchBisection(coefs).fit(0.0, 4.0, tolerance = 1e-9)]
+
+        for x, iterations, converged in results:
+            self.assertTrue(converged.all())
+            self.assertTrue(np.allclose(x, r, atol = 1e-8))
+            self.assertEqual(iterations.shape, r.shape)
+
+        # x ** 2 + 1 has no real root
+        x, iterations, converged = root.BatchNewton(np.polynomial.Polynomial([1, 0, 1])).fit(0.5, max_iter = 10)
+        self.assertFalse(converged[0])
+        self.assertEqual(iterations[0], 10)
+
+    def test_callable_root_finding(self):
+        # Test cases for Newton and secant methods with general callables and automatic derivatives
+        func = lambda x: np.cos(x) - x
+        expected = 0.7390851332151607
+
+        for derivative in ["complex_step", "forward"]:
+            result = root.Newton(func, derivative = derivative).fit(1.0, tolerance = 1e-12)
+            self.assertAlmostEqual(result, expected, delta = 1e-12)
+
+        result = root.Newton(func, lambda x: - np.sin(x) - 1).fit(1.0, tolerance = 1e-12)
+        self.assertAlmostEqual(result, expected, delta = 1e-12)
+        result = root.Secant(func).fit(0, 1, tolerance = 1e-12)
+        self.assertAlmostEqual(result, expected, delta = 1e-12)
+
+        # Per-lane parameters of a vectorized residual: x ** 3 - r ** 3 = 0
+        r = np.linspace(1, 3, 500)
+        func = lambda x, lanes: x ** 3 - r[lanes] ** 3
+        x, iterations, converged = root.BatchNewton(func, n_lanes = len(r)).fit(2.0, tolerance = 1e-10)
+        self.assertTrue(converged.all())
+        self.assertTrue(np.allclose(x, r, atol = 1e-8))
+
+        with self.assertRaises(TypeError):
+            root.Newton(1.0)
+
+    def test_polynomial_roots(self):
+        # Test cases for all (complex) roots of one or many polynomials
+        polynomial = np.polynomial.Polynomial.fromroots([-1, 2]) * np.polynomial.Polynomial([5, -2, 1])
+        expected = np.array([-1, 1 - 2j, 1 + 2j, 2])
+
+        for method in ["companion", "aberth"]:
+            result = root.PolyRoots(polynomial).fit(method = method)
+            self.assertTrue(np.allclose(result, expected, atol = 1e-10))
+
+        coefs = np.random.default_rng(0).normal(size = (200, 7))
+        result, iterations, converged = root.PolyRoots(coefs).fit(method = "aberth", full_output = True)
+        self.assertTrue(converged.all())
+        self.assertEqual(result.shape, (200, 6))
+
+        for roots, coef in zip(result, coefs):
+            distance = np.abs(roots[:, np.newaxis] - np.polynomial.polynomial.polyroots(coef))
+            self.assertLess(distance.min(axis = 1).max(), 1e-8)
+
+        other = np.polynomial.Polynomial.fromroots([-3, 0.5, 4, 6])
+        result = root.PolyRoots([polynomial, other]).fit()
+        self.assertTrue(np.allclose(result, [expected, [-3, 0.5, 4, 6]], atol = 1e-10))
+
+        with self.assertRaises(ValueError):
+            root.PolyRoots(polynomial).fit(method = "newton")
+
 class TestInterpolation(unittest.TestCase):
     
     def test_lagrange_interpolation(self):
@@ -39,8 +167,41 @@ class TestInterpolation(unittest.TestCase):
         Y = f(X)
         result = interpolate.Lagrange(X, Y).fit(3.5)
         self.assertAlmostEqual(result, f(3.5), delta = 1e-3)
+        self.assertAlmostEqual(interpolate.Lagrange(X, Y).poly()(3.5), f(3.5), delta = 1e-3)
+
+        # Many nodes over a wide span
+        nodes = 500 + 500 * np.cos(np.pi * (2 * np.arange(150) + 1) / 300)
+        points = np.linspace(0, 1000, 7)[1:-1]
+        result = interpolate.Lagrange(nodes, np.sin(3 * nodes / 1000)).fit(points)
+        self.assertTrue(np.allclose(result, np.sin(3 * points / 1000), atol = 1e-10))
         
 
+    def test_barycentric_interpolation(self):
+        # Test cases for barycentric Lagrange interpolation with appended nodes
+        f = lambda x: 8 * x + (2 * x ** 3) + (4 * x ** 4)
+        X = np.array([1,2,3,4,5])
+        barycentric = interpolate.Barycentric(X[:2], f(X[:2]))
+        barycentric.extend(X[2:], f(X[2:]))
+        self.assertAlmostEqual(barycentric.fit(3.5), f(3.5), delta = 1e-3)
+        self.assertAlmostEqual(barycentric.poly()(3.5), f(3.5), delta = 1e-3)
+
+        # Hundreds of appended Chebyshev nodes, in random order
+        g = lambda x: 1 / (1 + 25 * x ** 2)
+        nodes = np.random.permutation(np.cos(np.pi * np.arange(301) / 300))
+        barycentric = interpolate.Barycentric(nodes[:2], g(nodes[:2]))
+        barycentric.extend(nodes[2:], g(nodes[2:]))
+        points = np.linspace(-1, 1, 1001)
+        self.assertTrue(np.allclose(barycentric.fit(points), g(points), atol = 1e-10))
+
+    def test_chebyshev_interpolation(self):
+        # Test cases for barycentric interpolation on Chebyshev nodes
+        f = lambda x: 1 / (1 + 25 * x ** 2)
+        points = np.linspace(-1, 1, 1001)
+
+        for kind in [1, 2]:
+            result = interpolate.Barycentric.chebyshev(f, 200, [-1, 1], kind = kind).fit(points)
+            self.assertTrue(np.allclose(result, f(points), atol = 1e-10))
+
     def test_hermite_interpolation(self):
         # Test cases for Hermite interpolation
         f = lambda x: 8 * x + (2 * x ** 3) + (4 * x ** 4)
@@ -67,6 +228,66 @@ class TestInterpolation(unittest.TestCase):
         result = interpolate.NewtonDivDiff(X, Y).fit(4.5)
         self.assertAlmostEqual(result, f(4.5), delta = 1e-3)
 
+    def test_vectorized_interpolation(self):
+        # Test cases for evaluating interpolators over arrays of points
+        f = lambda x: 8 * x + (2 * x ** 3) + (4 * x ** 4)
+        f_prime = lambda x: 8 + (6 * x ** 2) + (16 * x ** 3)
+        X = np.array([1,2,3,4,5])
+        Y = f(X)
+        points = np.linspace(0, 6, 12).reshape(3, 4)
+        interpolators = [interpolate.Lagrange(X, Y), interpolate.Naville(X, Y),
+                         interpolate.NewtonDivDiff(X, Y), interpolate.Hermite(X, Y, f_prime(X))]
+
+        for interpolator in interpolators:
+            result = interpolator.fit(points)
+            self.assertEqual(result.shape, points.shape)
+            self.assertTrue(np.allclose(result, f(points)))
+
+    def test_streaming_newton_divided_difference(self):
+        # Test cases for appending nodes to Newton's divided difference, with a sliding window
+        X = np.linspace(0, 2, 12)
+        Y = np.sin(X)
+        points = np.linspace(1, 2, 5)
+
+        streaming = interpolate.NewtonDivDiff([], [])
+        streaming.extend(X, Y)
+        self.assertTrue(np.allclose(streaming.fit(points), interpolate.NewtonDivDiff(X, Y).fit(points)))
+
+        windowed = interpolate.NewtonDivDiff(X[:3], Y[:3], window = 5)
+        windowed.extend(X[3:], Y[3:])
+        self.assertTrue(np.array_equal(windowed.x_data, X[-5:]))
+        self.assertTrue(np.allclose(windowed.fit(points), interpolate.NewtonDivDiff(X[-5:], Y[-5:]).fit(points)))
+
+    def test_interpolating_polynomial(self):
+        # Test cases for the numeric and symbolic interpolating polynomials
+        f = lambda x: 8 * x + (2 * x ** 3) + (4 * x ** 4)
+        f_prime = lambda x: 8 + (6 * x ** 2) + (16 * x ** 3)
+        X = np.array([1,2,3,4,5])
+        Y = f(X)
+        interpolators = [interpolate.Lagrange(X, Y), interpolate.Naville(X, Y),
+                         interpolate.NewtonDivDiff(X, Y), interpolate.Hermite(X, Y, f_prime(X))]
+
+        for interpolator in interpolators:
+            self.assertTrue(np.allclose(interpolator.poly().coef, [0, 8, 0, 2, 4], atol = 1e-6))
+
+        expr = interpolate.NewtonDivDiff(X, Y).poly(symbolic = True)
+        self.assertAlmostEqual(float(expr.subs("x", 3.5)), f(3.5), delta = 1e-3)
+
+    def test_interpolation_cache(self):
+        # Test cases for reusing and invalidating the cached divided differences
+        f = lambda x: 8 * x + (2 * x ** 3) + (4 * x ** 4)
+        X = np.array([1,2,3,4,5])
+        newton = interpolate.NewtonDivDiff(X, f(X))
+        newton.fit(3.5)
+        coef = newton._state()
+        self.assertIs(newton._state(), coef)
+
+        newton.y_data = 2 * f(X)
+        self.assertAlmostEqual(newton.fit(3.5), 2 * f(3.5), delta = 1e-3)
+
+        with self.assertRaises(ValueError):
+            newton.x_data[0] = 0
+
 class TestQuad(unittest.TestCase):
     def test_simpson_rule(self):
         # Test cases for Simpson's rule
@@ -81,12 +302,93 @@ class TestQuad(unittest.TestCase):
         result = quad.Trapezoid(f, [0, 5], 100).fit()
         self.assertAlmostEqual(result, 191.6666666667, delta = 1e-2)  
 
+    def test_vectorized_composite_quadrature(self):
+        # Test cases for the vectorized and chunked composite rules
+        f = lambda x: np.exp(-x) * np.sin(3 * x)
+
+        for method in [quad.Trapezoid, quad.Simpson]:
+            expected = method(f, [0, 2], 1000).fit()
+            self.assertAlmostEqual(method(f, [0, 2], 1000, vectorized = True).fit(), expected, delta = 1e-12)
+            self.assertAlmostEqual(method(f, [0, 2], 1000, vectorized = True, chunk_size = 64).fit(), expected, delta = 1e-12)
+
+    def test_romberg_integration(self):
+        # Test cases for Romberg extrapolation of the trapezoidal rule
+        f = lambda x: np.exp(-x) * np.sin(3 * x)
+        exact = (3 - np.exp(-2) * (np.sin(6) + 3 * np.cos(6))) / 10
+        integral, error, n_eval = quad.Trapezoid(f, [0, 2], 1).romberg(tolerance = 1e-12, full_output = True)
+        self.assertAlmostEqual(integral, exact, delta = 1e-12)
+        self.assertLess(n_eval, 200)
+
+    def test_adaptive_quadrature(self):
+        # Test cases for adaptive Simpson and Gauss-Legendre quadrature
+        f = lambda x: np.sqrt(x)
+        integral, error, n_eval = quad.Adaptive(f, [0, 1], tolerance = 1e-8).fit(full_output = True)
+        self.assertAlmostEqual(integral, 2 / 3, delta = 1e-8)
+        self.assertLess(error, 1e-8)
+        self.assertLess(n_eval, 1000)
+
+        result = quad.Adaptive(f, [0, 1], tolerance = 1e-8, method = "gauss").fit()
+        self.assertAlmostEqual(result, 2 / 3, delta = 1e-8)
+
     def test_gaussian_quadrature(self):
         # Test cases for Gaussian quadrature
         f = lambda x: 2 * x + 4 * x ** 2
         result = quad.Gaussian(f, [0, 5], 2).fit()
         self.assertAlmostEqual(result, 191.6666666667, delta=1e-2)  
 
+    def test_vectorized_gaussian_quadrature(self):
+        # Test cases for Gaussian quadrature over many intervals and vector-valued integrands
+        a = np.linspace(0, 1, 1000)
+        b = a + 0.1
+        result = quad.Gaussian(np.exp, [a, b], 5, vectorized = True).fit()
+        self.assertTrue(np.allclose(result, np.exp(b) - np.exp(a), atol = 1e-12))
+
+        f = lambda x: np.stack([np.ones_like(x), x], axis = -1)
+        result = quad.Gaussian(f, [[0, 1], [1, 3]], 3, vectorized = True).fit()
+        self.assertTrue(np.allclose(result, [[1, 0.5], [2, 4]]))
+
+class TestPolynomial(unittest.TestCase):
+    def test_legendre_roots_weights(self):
+        # Test cases for Gauss-Legendre nodes and weights
+        for degree in [1, 2, 5, 200]:
+            legendre = polynomial.Legendre(degree)
+            roots, weights = np.polynomial.legendre.leggauss(degree)
+            self.assertTrue(np.allclose(legendre.roots, roots, atol = 1e-14))
+            self.assertTrue(np.allclose(legendre.weights, weights, atol = 1e-14))
+
+    def test_legendre_cache(self):
+        # Test cases for the in-memory and on-disk cache of roots and weights
+
+        with tempfile.TemporaryDirectory() as path:
+            cache = polynomial.LegendreCache(maxsize = 2, path = path)
+            cache.prewarm(range(2, 6))
+            self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (0, 0, 4))
+
+            cache = polynomial.LegendreCache(path = path)
+            roots, weights = cache.get(3)
+            cache.get(3)
+            self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (1, 1, 0))
+            self.assertTrue(np.allclose(weights, [5 / 9, 8 / 9, 5 / 9]))
+
+            f = lambda x: 2 * x + 4 * x ** 2
+            result = quad.Gaussian(f, [0, 5], 3, cache = cache).fit()
+            self.assertAlmostEqual(result, 191.6666666667, delta = 1e-8)
+            self.assertEqual(cache.hits, 2)
+
+            # Truncated and empty files count as misses and are rewritten
+            with open(os.path.join(path, "legendre_4.npz"), "r+b") as file:
+                file.truncate(os.path.getsize(file.name) // 2)
+
+            open(os.path.join(path, "legendre_5.npz"), "wb").close()
+            cache = polynomial.LegendreCache(path = path)
+            cache.get(4)
+            cache.get(5)
+            self.assertEqual((cache.disk_hits, cache.misses), (0, 2))
+            cache = polynomial.LegendreCache(path = path)
+            roots, weights = cache.get(5)
+            self.assertEqual(cache.disk_hits, 1)
+            self.assertAlmostEqual(weights.sum(), 2, delta = 1e-12)
+
 class TestLeastSquares(unittest.TestCase):
     def test_ols(self):
         # Test cases for Ordinary Least Squares (OLS)
@@ -104,6 +406,210 @@ class TestLeastSquares(unittest.TestCase):
         result_coef = least_squares.PLS(X, f(X)).fit(degree = 2, show_coef = True)[2]
         self.assertAlmostEqual(result_coef[1], 2, delta = 0.1)
 
+    def test_least_squares_solver(self):
+        # Test cases for the shared least squares solvers and the Vandermonde matrix
+        X = np.linspace(-1, 1, 1000)
+        coef = np.arange(1, 9)
+        Y = np.polynomial.polynomial.polyval(X, coef)
+        self.assertTrue(np.allclose(least_squares.vandermonde(X, 7), np.vander(X, 8, increasing = True)))
+
+        for method in ["auto", "cholesky", "qr", "svd"]:
+            pred, error, result_coef = least_squares.PLS(X, Y).fit(degree = 7, show_coef = True, method = method)
+            self.assertTrue(np.allclose(result_coef, coef, atol = 1e-6))
+            self.assertLess(error, 1e-12)
+
+        pred, error = least_squares.OLS(X, 3 * X + 8).fit(formula = 'linear')
+        self.assertTrue(np.allclose(pred, 3 * X + 8))
+
+        with self.assertRaises(ValueError):
+            least_squares.lstsq(np.ones((3, 1)), np.ones(3), method = "lu")
+
+    def test_streaming_least_squares(self):
+        # Test cases for out-of-core fits over memory-mapped arrays and iterators of chunks
+        n = 10000
+        X = np.random.uniform(-1, 1, n)
+        Y = 8 + 2 * X + 3 * X ** 2 + np.random.randn(n)
+
+        with tempfile.TemporaryDirectory() as directory:
+            x_map = np.memmap(os.path.join(directory, "x.dat"), dtype = float, mode = "w+", shape = (n,))
+            y_map = np.memmap(os.path.join(directory, "y.dat"), dtype = float, mode = "w+", shape = (n,))
+            x_map[:], y_map[:] = X, Y
+
+            pred, error, coef = least_squares.PLS(X, Y).fit(degree = 2, show_coef = True)
+            result_coef, result_error = least_squares.PLS(x_map, y_map).fit_stream(degree = 2, chunk_size = 999)
+            self.assertTrue(np.allclose(result_coef, coef))
+            self.assertAlmostEqual(result_error, error, delta = 1e-10)
+            del x_map, y_map
+
+        chunks = ((X[i:i + 1000], Y[i:i + 1000]) for i in range(0, n, 1000))
+        result_coef, result_error = least_squares.OLS().fit_stream(chunks = chunks)
+        pred, error, coef = least_squares.OLS(X, Y).fit(formula = 'linear', show_coef = True)
+        self.assertTrue(np.allclose(result_coef, coef))
+        self.assertAlmostEqual(result_error, error, delta = 1e-10)
+
+    def test_recursive_least_squares(self):
+        # Test cases for online fits with partial_fit, with and without forgetting
+        n = 1000
+        X = np.random.uniform(-1, 1, n)
+        Y = 8 + 2 * X + 3 * X ** 2 + np.random.randn(n)
+        pls = least_squares.PLS()
+
+        for i in range(0, n, 10):
+            result_coef, result_error = pls.partial_fit(X[i:i + 10], Y[i:i + 10], degree = 2)
+
+        pred, error, coef = least_squares.PLS(X, Y).fit(degree = 2, show_coef = True)
+        self.assertTrue(np.allclose(result_coef, coef))
+        self.assertAlmostEqual(result_error, error, delta = 1e-10)
+
+        # The slope changes from 1 to 5 halfway through
+        ols = least_squares.OLS()
+
+        for i in range(n):
+            result_coef, result_error = ols.partial_fit(X[i], (1 if i < n // 2 else 5) * X[i], forgetting = 0.95)
+
+        self.assertAlmostEqual(result_coef[1], 5, delta = 1e-6)
+
+        # A regressor that stays 0 starts from a ridge solution after a bounded buffer
+        design = np.column_stack([X, np.zeros(n)])
+        recursive = least_squares.RecursiveLeastSquares(3)
+
+        for i in range(n):
+            recursive.update(np.append(1, design[i]), 8 + 2 * X[i])
+
+        self.assertEqual(len(recursive._X), 0)
+        self.assertTrue(np.allclose(recursive.coef, [8, 2, 0], atol = 1e-6))
+
+    def test_multi_response_least_squares(self):
+        # Test cases for fitting many series sampled on the same x at once
+        n, m = 200, 30
+        X = np.linspace(0, 10, n)
+        coef = np.random.randn(3, m)
+        Y = least_squares.vandermonde(X, 2) @ coef + 0.01 * np.random.randn(n, m)
+
+        pred, error, result_coef = least_squares.PLS(X, Y).fit(degree = 2, show_coef = True)
+        self.assertEqual(pred.shape, (n, m))
+        self.assertEqual(error.shape, (m,))
+        self.assertTrue(np.allclose(result_coef, coef, atol = 0.05))
+
+        for j in [0, m - 1]:
+            pred_j, error_j, coef_j = least_squares.PLS(X, Y[:, j]).fit(degree = 2, show_coef = True)
+            self.assertTrue(np.allclose(pred[:, j], pred_j))
+            self.assertAlmostEqual(error[j], error_j, delta = 1e-12)
+
+        result_coef, result_error = least_squares.PLS(X, Y).fit_stream(degree = 2, chunk_size = 64)
+        self.assertTrue(np.allclose(result_error, error))
+
+        result_coef, result_error = least_squares.PLS().partial_fit(X, Y, degree = 2)
+        self.assertTrue(np.allclose(result_error, error))
+
+        pred, error = least_squares.OLS(X, Y).fit(formula = 'linear')
+        self.assertEqual(pred.shape, (n, m))
+
+    def test_orthogonal_polynomial_least_squares(self):
+        # Test cases for PLS in a basis of polynomials orthogonal over the data
+        n = 1000
+        X = np.linspace(0, 100, n)
+        f = lambda x: np.sin(x / 10) * np.exp(x / 100)
+        Y = f(X)
+
+        pred, error, coef = least_squares.PLS(X, Y).fit(degree = 4, show_coef = True)
+        result_pred, result_error, result_coef = least_squares.PLS(X, Y).fit(degree = 4, show_coef = True, basis = "orthogonal")
+        self.assertTrue(np.allclose(result_pred, pred))
+        self.assertTrue(np.allclose(result_coef, coef))
+
+        errors, polynomials = least_squares.PLS(X, Y).fit_path(max_degree = 20)
+        self.assertEqual(len(polynomials), 21)
+        self.assertTrue(np.all(np.diff(errors) <= 1e-15))
+        self.assertLess(errors[20], 1e-12)
+        self.assertTrue(np.allclose(polynomials[20](X), f(X), atol = 1e-5))
+        self.assertTrue(np.allclose(polynomials[4](X), pred))
+
+    def test_degree_selection(self):
+        # Test cases for closed-form leave-one-out cross validation and information criteria
+        n = 60
+        X = np.linspace(-1, 1, n)
+        Y = 1 - 2 * X + 3 * X ** 3 + 0.3 * np.random.randn(n)
+
+        degree, scores = least_squares.PLS(X, Y).select_degree(max_degree = 8, criterion = "loocv")
+        self.assertEqual(scores.shape, (9,))
+        self.assertEqual(degree, np.argmin(scores))
+
+        # Leave-one-out refits of degree 3
+        errors = []
+        for i in range(n):
+            keep = np.arange(n) != i
+            coef = least_squares.PLS(X[keep], Y[keep]).fit(degree = 3, show_coef = True)[2]
+            errors.append((Y[i] - np.polynomial.polynomial.polyval(X[i], coef)) ** 2)
+
+        self.assertAlmostEqual(scores[3], np.mean(errors), delta = 1e-10)
+
+        for criterion in ["gcv", "aic", "bic"]:
+            degree, scores = least_squares.PLS(X, Y).select_degree(max_degree = 8, criterion = criterion)
+            self.assertGreaterEqual(degree, 3)
+
+    def test_nonlinear_least_squares(self):
+        # Test cases for Levenberg-Marquardt fits of the exp and power formulas and of user models
+        X = np.linspace(0.1, 3, 100)
+        f = lambda x: 2.5 * np.exp(0.8 * x)
+        ols = least_squares.OLS(X, f(X))
+        pred, error, coef = ols.fit(formula = 'exp', show_coef = True)
+        self.assertTrue(np.allclose(coef, [2.5, 0.8]))
+        self.assertTrue(ols.converged)
+        self.assertLess(error, 1e-20)
+
+        # Noise makes the nonlinear fit differ from the log-linear start
+        Y = 2.5 * X ** 1.7 + 0.3 * np.random.randn(100)
+        ols = least_squares.OLS(X, Y)
+        pred, error, coef = ols.fit(formula = 'power', show_coef = True)
+        self.assertAlmostEqual(coef[1], 1.7, delta = 0.1)
+        self.assertAlmostEqual(ols.cost, error, delta = 1e-12)
+
+        # Many exp series at once
+        B, A = np.random.uniform(1, 3, 50), np.random.uniform(-1, 1, 50)
+        Y = B * np.exp(np.outer(X, A))
+        pred, error, coef = least_squares.OLS(X, Y).fit(formula = 'exp', show_coef = True)
+        self.assertTrue(np.allclose(coef[0], B) and np.allclose(coef[1], A))
+
+        model = lambda x, a, b, c: a * np.sin(b * x) + c
+        params, error, iterations, converged = least_squares.NonlinearLS(X, model(X, 2, 1.3, 0.5)).fit(
+            model, [1, 1, 0], full_output = True)
+        self.assertTrue(converged)
+        self.assertTrue(np.allclose(params, [2, 1.3, 0.5]))
+
+    def test_sparse_multivariate_ols(self):
+        # Test cases for OLS with many regressors, dense or sparse, and iterative solvers
+        n, k = 2000, 100
+        X = np.random.randn(n, k) * (np.random.rand(n, k) < 0.05) * np.linspace(0.1, 100, k)
+        beta = np.random.randn(k)
+        Y = 3 + X @ beta + 0.01 * np.random.randn(n)
+        sparse = least_squares.CSRMatrix.from_dense(X)
+        self.assertTrue(np.allclose(sparse.toarray(), X))
+        self.assertLess(sparse.nnz, 0.1 * n * k)
+
+        pred, error, coef = least_squares.OLS(X, Y).fit(formula = 'linear', show_coef = True)
+        self.assertEqual(len(coef), k + 1)
+
+        for method in ["auto", "lsqr", "cgls"]:
+            ols = least_squares.OLS(sparse, Y)
+            result_pred, result_error, result_coef = ols.fit(formula = 'linear', show_coef = True, method = method)
+            self.assertTrue(np.allclose(result_coef, coef, atol = 1e-6))
+            self.assertAlmostEqual(result_error, error, delta = 1e-10)
+            self.assertLess(ols.iterations, k)
+
+        # Any object with the CSR layout, without matrix products of its own
+        layout = type("Layout", (), {"data": sparse.data, "indices": sparse.indices,
+                                     "indptr": sparse.indptr, "shape": sparse.shape})()
+        result_pred, result_error = least_squares.OLS(layout, Y).fit(formula = 'linear')
+        self.assertAlmostEqual(result_error, error, delta = 1e-10)
+
+        # Ridge damping of the slopes, with the direct and the iterative solvers
+        result_coef = least_squares.OLS(X, Y).fit(formula = 'linear', show_coef = True, damping = 10.0)[2]
+        coef = least_squares.OLS(sparse, Y).fit(formula = 'linear', show_coef = True, damping = 10.0)[2]
+        self.assertTrue(np.allclose(result_coef, coef, atol = 1e-6))
+
+        with self.assertRaises(ValueError):
+            least_squares.OLS(sparse, Y).fit(formula = 'linear', method = 'qr')
+
 
 if __name__ == '__main__':
     unittest.main()